@@ -4,22 +4,35 @@ Copyright (c) 2024 Felix Geilert
 """
 
 import asyncio
-from datetime import datetime, timezone
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from pathlib import Path
 from unittest.mock import AsyncMock, Mock
 
 import aiohttp
 import pytest
-from aioresponses import aioresponses
+from aioresponses import CallbackResult, aioresponses
+from yarl import URL
 
-from whoopy.client_v2 import WhoopClientV2
+from whoopy.client_v2 import WhoopClientV2, _read_config_file
 from whoopy.exceptions import (
+    ConfigurationError,
     RateLimitError,
     ResourceNotFoundError,
     ServerError,
+    SessionClosedError,
     TokenExpiredError,
     ValidationError,
 )
-from whoopy.utils import RetryConfig, TokenInfo
+from whoopy.sync_wrapper import WhoopClientV2Sync
+from whoopy.utils import OAuth2Helper, RequestThrottler, RetryableSession, RetryConfig, TokenInfo
+from whoopy.utils.retry import calculate_backoff_delay
 
 
 class TestWhoopClientV2:
@@ -56,6 +69,18 @@ class TestWhoopClientV2:
         # After exiting, session should be closed
         assert client._session.closed
 
+    @pytest.mark.asyncio
+    async def test_client_without_session_raises(self, client):
+        """Test using the client outside its context raises SessionClosedError."""
+        with pytest.raises(SessionClosedError):
+            _ = client.cycles
+
+        async with client:
+            pass
+
+        with pytest.raises(SessionClosedError):
+            await client.request("GET", "test")
+
     @pytest.mark.asyncio
     async def test_client_headers(self, client, token_info):
         """Test client sets proper headers."""
@@ -71,6 +96,7 @@ class TestWhoopClientV2:
         async with client as whoop:
             response = Mock()
             response.status = 200
+            response.headers = {}
 
             # Should not raise any exception
             await whoop.check_response(response)
@@ -82,10 +108,11 @@ class TestWhoopClientV2:
             # 400 Bad Request
             response = Mock()
             response.status = 400
-            response.json = AsyncMock(return_value={"error": "bad request"})
+            response.read = AsyncMock(return_value=b'{"error": "bad request"}')
 
-            with pytest.raises(ValidationError):
+            with pytest.raises(ValidationError) as validation_info:
                 await whoop.check_response(response)
+            assert validation_info.value.validation_errors == {"error": "bad request"}
 
             # 401 Unauthorized
             response.status = 401
@@ -104,11 +131,40 @@ class TestWhoopClientV2:
                 await whoop.check_response(response)
             assert exc_info.value.retry_after == 60
 
-            # 500 Server Error
+            # 500 Server Error with a non-JSON body
             response.status = 500
             response.headers = {}
-            with pytest.raises(ServerError):
+            response.read = AsyncMock(return_value=b"<html>Internal Server Error</html>")
+            with pytest.raises(ServerError) as server_info:
                 await whoop.check_response(response)
+            assert server_info.value.details["response"] == "<html>Internal Server Error</html>"
+
+    @pytest.mark.asyncio
+    async def test_check_response_rate_limit_headers(self, client):
+        """Test rate limit headers pause requests and HTTP-date Retry-After is parsed."""
+        async with client as whoop:
+            # Quota exhausted on a successful response
+            response = Mock()
+            response.status = 200
+            response.headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "30"}
+            await whoop.check_response(response)
+            assert whoop._throttler._paused_until - time.monotonic() > 25
+
+            # Retry-After given as an HTTP date
+            response.status = 429
+            response.read = AsyncMock(return_value=b"{}")
+            retry_at = datetime.now(timezone.utc) + timedelta(seconds=120)
+            response.headers = {"Retry-After": format_datetime(retry_at, usegmt=True)}
+            with pytest.raises(RateLimitError) as exc_info:
+                await whoop.check_response(response)
+            assert 100 <= exc_info.value.retry_after <= 120
+
+            # HTTP date with a "-0000" zone, which parses to a naive datetime
+            response.headers = {"Retry-After": format_datetime(retry_at.replace(tzinfo=None))}
+            assert response.headers["Retry-After"].endswith("-0000")
+            with pytest.raises(RateLimitError) as exc_info:
+                await whoop.check_response(response)
+            assert 100 <= exc_info.value.retry_after <= 120
 
     @pytest.mark.asyncio
     async def test_refresh_token(self, client):
@@ -124,12 +180,42 @@ class TestWhoopClientV2:
 
                 m.post("https://api.prod.whoop.com/oauth/oauth2/token", payload=new_token_data)
 
-                await whoop.refresh_token()
+                await whoop.refresh_token(force=True)
 
                 assert whoop.token_info.access_token == "new_access_token"
                 assert whoop.token_info.refresh_token == "new_refresh_token"
                 assert whoop.session.headers["Authorization"] == "Bearer new_access_token"
 
+    @pytest.mark.asyncio
+    async def test_refresh_skipped_for_valid_token(self, client):
+        """Test refreshing a token with plenty of lifetime left makes no request."""
+        async with client as whoop:
+            with aioresponses():
+                # Any request would fail with a connection error
+                await whoop.refresh_token()
+
+            assert whoop.token_info.access_token == "test_access_token"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refresh_is_single_flight(self, client):
+        """Test concurrent refreshes of the same stale token only hit the token endpoint once."""
+        async with client as whoop:
+
+            async def slow_token_response(_url, **_kwargs):
+                # Keep the first refresh in flight so the others queue up behind it
+                await asyncio.sleep(0.01)
+                return CallbackResult(
+                    payload={"access_token": "new_access_token", "expires_in": 3600, "refresh_token": "new_refresh"}
+                )
+
+            with aioresponses() as m:
+                # Registered once: a second refresh request would fail with a connection error
+                m.post("https://api.prod.whoop.com/oauth/oauth2/token", callback=slow_token_response)
+
+                await asyncio.gather(*(whoop.refresh_token(force=True) for _ in range(3)))
+
+                assert whoop.token_info.access_token == "new_access_token"
+
     @pytest.mark.asyncio
     async def test_request_with_token_refresh(self, client):
         """Test automatic token refresh on 401."""
@@ -178,6 +264,50 @@ class TestAuthenticationMethods:
         assert client.client_id == "client_id"
         assert client.client_secret == "client_secret"
 
+    @pytest.mark.asyncio
+    async def test_auth_flow_leaves_no_open_session(self, monkeypatch):
+        """Test auth_flow prompts off the event loop and returns a client without an open session."""
+        prompt_threads = []
+
+        def fake_input(_prompt):
+            prompt_threads.append(threading.current_thread())
+            return "http://localhost:1234/?state=xyz&code=auth_code"
+
+        monkeypatch.setattr("builtins.input", fake_input)
+
+        with aioresponses() as m:
+            m.post(
+                OAuth2Helper.TOKEN_URL,
+                payload={"access_token": "new_token", "expires_in": 3600, "refresh_token": "new_refresh"},
+            )
+            client = await WhoopClientV2.auth_flow("client_id", "client_secret", open_browser=False)
+
+        assert len(prompt_threads) == 1
+        assert prompt_threads[0] is not threading.current_thread()
+        assert client.token_info.access_token == "new_token"
+        assert client._session is None
+
+    @pytest.mark.asyncio
+    async def test_exchange_code_reuses_session(self):
+        """Test the session opened by exchange_code is the one the async with block uses and closes."""
+        client = WhoopClientV2(client_id="client_id", client_secret="client_secret")
+
+        with aioresponses() as m:
+            m.post(
+                OAuth2Helper.TOKEN_URL,
+                payload={"access_token": "new_token", "expires_in": 3600, "refresh_token": "new_refresh"},
+            )
+            await client.exchange_code("auth_code")
+
+        session = client._session
+        assert session is not None
+        assert session.headers["Authorization"] == "Bearer new_token"
+
+        async with client as whoop:
+            assert whoop._session is session
+
+        assert session.closed
+
     @pytest.mark.asyncio
     async def test_from_config(self, tmp_path):
         """Test creating client from config files."""
@@ -229,6 +359,90 @@ class TestAuthenticationMethods:
         assert saved_data["refresh_token"] == "refresh_token"
         assert saved_data["scopes"] == ["read:cycles"]
 
+    def test_save_token_to_current_directory(self, tmp_path, monkeypatch):
+        """Test saving a token to a bare filename without client credentials."""
+        monkeypatch.chdir(tmp_path)
+        token_info = TokenInfo(access_token="test_token", expires_in=3600, refresh_token=None, scopes=[])
+
+        WhoopClientV2(token_info=token_info).save_token("token.json")
+
+        assert (tmp_path / "token.json").exists()
+        assert not list(tmp_path.glob("*.tmp"))
+
+        # The write invalidates cached reads of the same file
+        helper = OAuth2Helper(client_id="client_id", client_secret="client_secret")
+        assert helper.load_token("token.json").access_token == "test_token"
+        token_info = TokenInfo(access_token="rotated", expires_in=3600, refresh_token=None, scopes=[])
+        WhoopClientV2(token_info=token_info).save_token("token.json")
+        assert helper.load_token("token.json").access_token == "rotated"
+
+    def test_load_token_reflects_saved_changes(self, tmp_path):
+        """Test cached token loading picks up newly saved tokens."""
+        helper = OAuth2Helper(client_id="client_id", client_secret="client_secret")
+        token_file = str(tmp_path / "token.json")
+
+        assert helper.load_token(token_file) is None
+
+        helper.save_token(TokenInfo(access_token="first", expires_in=3600, refresh_token=None, scopes=[]), token_file)
+        assert helper.load_token(token_file).access_token == "first"
+
+        helper.save_token(TokenInfo(access_token="second", expires_in=3600, refresh_token=None, scopes=[]), token_file)
+        assert helper.load_token(token_file).access_token == "second"
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_failed_token_write_keeps_old_file(self, tmp_path, monkeypatch):
+        """Test a write that fails midway leaves the old token and no temporary file behind."""
+        helper = OAuth2Helper(client_id="client_id", client_secret="client_secret")
+        token_file = str(tmp_path / "token.json")
+        helper.save_token(TokenInfo(access_token="first", expires_in=3600, refresh_token=None, scopes=[]), token_file)
+
+        def broken_dump(*_args, **_kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("whoopy.utils.auth.json.dump", broken_dump)
+        with pytest.raises(OSError, match="disk full"):
+            helper.save_token(
+                TokenInfo(access_token="second", expires_in=3600, refresh_token=None, scopes=[]), token_file
+            )
+
+        monkeypatch.undo()
+        assert helper.load_token(token_file).access_token == "first"
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_from_config_reflects_config_changes(self, tmp_path):
+        """Test cached config loading picks up edits to the config file."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"client_id": "first_id", "client_secret": "secret"}')
+        token_path = str(tmp_path / "missing_token.json")
+
+        assert WhoopClientV2.from_config(str(config_file), token_path).client_id == "first_id"
+
+        config_file.write_text('{"whoop": {"client_id": "second_id", "client_secret": "secret"}}')
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert WhoopClientV2.from_config(str(config_file), token_path).client_id == "second_id"
+
+        with pytest.raises(ConfigurationError):
+            WhoopClientV2.from_config(str(tmp_path / "missing.json"), token_path)
+
+    def test_cached_reads_return_copies(self, tmp_path):
+        """Test mutating a cached config or token does not leak into later reads."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"whoop": {"client_id": "client_id", "client_secret": "secret"}}')
+        mtime_ns = config_file.stat().st_mtime_ns
+
+        _read_config_file(str(config_file), mtime_ns)["whoop"].pop("client_id")
+        assert _read_config_file(str(config_file), mtime_ns)["whoop"]["client_id"] == "client_id"
+
+        helper = OAuth2Helper(client_id="client_id", client_secret="client_secret")
+        token_file = str(tmp_path / "token.json")
+        helper.save_token(
+            TokenInfo(access_token="token", expires_in=3600, refresh_token=None, scopes=["a"]), token_file
+        )
+
+        helper.load_token(token_file).scopes.append("b")
+        assert helper.load_token(token_file).scopes == ["a"]
+
 
 class TestRetryLogic:
     """Test retry functionality."""
@@ -278,3 +492,283 @@ class TestRetryLogic:
                 assert data == {"data": "success"}
                 # Should have waited at least 1 second
                 assert end_time - start_time >= 0.9  # Allow small variance
+
+    def test_backoff_delay_uses_retry_after_as_floor(self):
+        """Test Retry-After bounds the backoff from below without replacing longer backoffs."""
+        config = RetryConfig(base_delay=1.0, max_delay=60.0, jitter=False)
+
+        assert calculate_backoff_delay(0, config, retry_after=5) == 5.0
+        assert calculate_backoff_delay(4, config, retry_after=5) == 16.0
+        assert calculate_backoff_delay(10, config) == 60.0
+
+    def test_full_jitter_backoff(self):
+        """Test full jitter spreads delays between zero and the capped backoff."""
+        config = RetryConfig(base_delay=1.0, max_delay=60.0, jitter_mode="full")
+
+        delays = [calculate_backoff_delay(3, config) for _ in range(100)]
+
+        assert all(0 <= delay <= 8.0 for delay in delays)
+        assert min(delays) < 4.0 < max(delays)
+        assert calculate_backoff_delay(3, config, retry_after=30) >= 30
+
+    def test_backoff_strategies(self):
+        """Test Fibonacci and fixed strategies, including attempts past max_attempts."""
+        fib = RetryConfig(max_attempts=6, base_delay=1.0, max_delay=6.0, jitter=False, strategy="fib")
+        fixed = RetryConfig(max_attempts=3, base_delay=2.0, jitter=False, strategy="fixed")
+
+        assert [calculate_backoff_delay(attempt, fib) for attempt in range(7)] == [1.0, 1.0, 2.0, 3.0, 5.0, 6.0, 6.0]
+        assert [calculate_backoff_delay(attempt, fixed) for attempt in range(4)] == [2.0, 2.0, 2.0, 2.0]
+        assert list(fib.schedule()) == [1.0, 1.0, 2.0, 3.0, 5.0, 6.0]
+
+    def test_base_backoff_past_max_attempts(self):
+        """Test base_backoff past the precomputed table returns max_delay once the backoff has saturated."""
+        saturated = RetryConfig(max_attempts=4, base_delay=1.0, max_delay=4.0, jitter=False)
+        unsaturated = RetryConfig(max_attempts=2, base_delay=1.0, max_delay=60.0, jitter=False)
+
+        assert saturated.base_backoff(3) == 4.0
+        assert [saturated.base_backoff(attempt) for attempt in (4, 10, 100)] == [4.0, 4.0, 4.0]
+        assert [unsaturated.base_backoff(attempt) for attempt in (2, 3, 10)] == [4.0, 8.0, 60.0]
+
+    def test_retry_config_is_retryable(self):
+        """Test retryable exceptions are matched by exact type and by subclass."""
+
+        class GatewayError(ServerError):
+            pass
+
+        config = RetryConfig()
+
+        assert config.is_retryable(RateLimitError("limited"))
+        assert config.is_retryable(GatewayError(502))
+        assert not config.is_retryable(ValidationError("invalid"))
+
+    @pytest.mark.asyncio
+    async def test_retry_after_beyond_max_delay_is_raised(self):
+        """Test a Retry-After longer than max_delay is surfaced instead of slept through."""
+        token_info = TokenInfo(access_token="test_token", expires_in=3600, refresh_token=None, scopes=[])
+        retry_config = RetryConfig(max_attempts=3, base_delay=0.1, max_delay=10.0, jitter=False)
+        client = WhoopClientV2(token_info=token_info, retry_config=retry_config, auto_refresh_token=False)
+
+        async with client as whoop:
+            with aioresponses() as m:
+                m.get("https://api.prod.whoop.com/developer/v2/test", status=429, headers={"Retry-After": "3600"})
+
+                with pytest.raises(RateLimitError) as exc_info:
+                    await whoop.request("GET", "test")
+                assert exc_info.value.retry_after == 3600
+
+    @pytest.mark.asyncio
+    async def test_retry_after_is_capped(self):
+        """Test an absurd Retry-After is clamped when the header is parsed."""
+        token_info = TokenInfo(access_token="test_token", expires_in=3600, refresh_token=None, scopes=[])
+        retry_config = RetryConfig(max_attempts=1, jitter=False)
+        client = WhoopClientV2(token_info=token_info, retry_config=retry_config, auto_refresh_token=False)
+
+        async with client as whoop:
+            with aioresponses() as m:
+                m.get("https://api.prod.whoop.com/developer/v2/test", status=429, headers={"Retry-After": "31536000"})
+
+                with pytest.raises(RateLimitError) as exc_info:
+                    await whoop.request("GET", "test")
+                assert exc_info.value.retry_after == 3600
+
+    @pytest.mark.asyncio
+    async def test_retry_stops_at_max_elapsed(self):
+        """Test no retry is attempted once its backoff would exceed the time budget."""
+        token_info = TokenInfo(access_token="test_token", expires_in=3600, refresh_token=None, scopes=[])
+        retry_config = RetryConfig(max_attempts=5, base_delay=0.1, jitter=False, max_elapsed=0.25)
+        client = WhoopClientV2(token_info=token_info, retry_config=retry_config, auto_refresh_token=False)
+
+        async with client as whoop:
+            with aioresponses() as m:
+                for _ in range(5):
+                    m.get("https://api.prod.whoop.com/developer/v2/test", status=500)
+
+                with pytest.raises(ServerError):
+                    await whoop.request("GET", "test")
+
+                # 0.1s and 0.2s backoffs fit only the first retry into the 0.25s budget
+                assert sum(len(calls) for calls in m.requests.values()) == 2
+
+    @pytest.mark.asyncio
+    async def test_retry_after_gates_later_requests(self, monkeypatch):
+        """Test a Retry-After holds back later requests on the session for at most max_delay."""
+        token_info = TokenInfo(access_token="test_token", expires_in=3600, refresh_token=None, scopes=[])
+        retry_config = RetryConfig(max_attempts=1, base_delay=0.1, max_delay=10.0, jitter=False)
+        client = WhoopClientV2(token_info=token_info, retry_config=retry_config, auto_refresh_token=False)
+        sleep = AsyncMock()
+        url = "https://api.prod.whoop.com/developer/v2"
+
+        async with client as whoop:
+            with aioresponses() as m:
+                m.get(f"{url}/test", status=429, headers={"Retry-After": "5"})
+                m.get(f"{url}/other", status=200, payload={"ok": True})
+
+                with pytest.raises(RateLimitError):
+                    await whoop.request("GET", "test")
+
+                # A gate within max_delay is waited out before the next request
+                monkeypatch.setattr("whoopy.utils.retry.asyncio.sleep", sleep)
+                response = await whoop.request("GET", "other")
+                assert response.status == 200
+                assert 4 < sleep.await_args.args[0] <= 5
+
+                # A gate beyond max_delay is raised without sleeping or sending the request
+                m.get(f"{url}/test", status=429, headers={"Retry-After": "3600"})
+                with pytest.raises(RateLimitError):
+                    await whoop.request("GET", "test")
+
+                sleep.reset_mock()
+                with pytest.raises(RateLimitError) as exc_info:
+                    await whoop.request("GET", "other")
+                assert exc_info.value.retry_after > 3590
+                sleep.assert_not_awaited()
+                assert len(m.requests[("GET", URL(f"{url}/other"))]) == 1
+
+
+class TestRequestThrottler:
+    """Test request throttling."""
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_allows_burst(self):
+        """Test token bucket lets a burst through without waiting."""
+        throttler = RequestThrottler(rate_limit=5, period=60.0)
+
+        start_time = asyncio.get_event_loop().time()
+        for _ in range(5):
+            async with throttler:
+                pass
+        end_time = asyncio.get_event_loop().time()
+
+        assert end_time - start_time < 0.1
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_waits_when_bucket_empty(self):
+        """Test token bucket waits for a refill once exhausted."""
+        throttler = RequestThrottler(rate_limit=10, period=1.0)
+
+        start_time = asyncio.get_event_loop().time()
+        for _ in range(11):
+            async with throttler:
+                pass
+        end_time = asyncio.get_event_loop().time()
+
+        # The 11th request needs one token refilled (0.1s)
+        assert end_time - start_time >= 0.05
+
+    @pytest.mark.asyncio
+    async def test_max_concurrent_bounds_requests_in_flight(self):
+        """Test only sends hold an in-flight slot, so backoff sleeps do not block other requests."""
+        throttler = RequestThrottler(max_concurrent=2)
+        in_flight = 0
+        peak = 0
+        sent = []
+
+        async def send(method, url, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            sent.append(url)
+            return Mock(status=200)
+
+        async def check_response(response):
+            # The first attempt of "flaky" fails and backs off for 0.2s
+            if sent.count("flaky") == 1 and sent[-1] == "flaky":
+                raise ServerError(503)
+
+        session = Mock(request=send)
+        retry_config = RetryConfig(max_attempts=2, base_delay=0.2, jitter=False)
+        retry_session = RetryableSession(session, retry_config, check_response, in_flight=throttler.in_flight)
+
+        await asyncio.gather(retry_session.get("flaky"), *(retry_session.get(f"ok{i}") for i in range(6)))
+
+        assert peak == 2
+        # All other requests went out while "flaky" was backing off
+        assert sent[-1] == "flaky"
+        assert sent.count("flaky") == 2
+
+
+class TestSyncClient:
+    """Test the synchronous client wrapper."""
+
+    def test_clients_share_loop_thread(self):
+        """Test sync clients run on one shared loop thread that outlives close()."""
+        token_info = TokenInfo(access_token="test_access_token", expires_in=3600, refresh_token=None, scopes=[])
+        first = WhoopClientV2Sync(token_info=token_info)
+        second = WhoopClientV2Sync(token_info=token_info)
+
+        try:
+            assert first.user is not None
+            assert second.user is not None
+            loop_thread = first._loop_thread
+            assert loop_thread is not None
+            assert second._loop_thread is loop_thread
+
+            first.close()
+            assert loop_thread.thread is not None
+            assert loop_thread.thread.is_alive()
+            assert second.user is not None
+        finally:
+            first.close()
+            second.close()
+
+    def test_auth_flow_reuses_exchange_session(self, monkeypatch):
+        """Test the sync auth_flow prompts in the calling thread and keeps the exchange session."""
+        prompt_threads = []
+
+        def fake_input(_prompt):
+            prompt_threads.append(threading.current_thread())
+            return "http://localhost:1234/?state=xyz&code=auth_code"
+
+        monkeypatch.setattr("builtins.input", fake_input)
+        opened = []
+        open_session = WhoopClientV2._open_session
+        monkeypatch.setattr(WhoopClientV2, "_open_session", lambda self: opened.append(open_session(self)))
+
+        with aioresponses() as m:
+            m.post(
+                OAuth2Helper.TOKEN_URL,
+                payload={"access_token": "new_token", "expires_in": 3600, "refresh_token": "new_refresh"},
+            )
+            client = WhoopClientV2Sync.auth_flow("client_id", "client_secret", open_browser=False)
+
+        try:
+            assert prompt_threads == [threading.current_thread()]
+            assert client.user is not None
+            assert len(opened) == 1
+            assert client._async_client.session.headers["Authorization"] == "Bearer new_token"
+        finally:
+            client.close()
+
+    def test_iterate_yields_lazily(self):
+        """Test sync iterate is a generator that streams items page by page."""
+        token_info = TokenInfo(access_token="test_access_token", expires_in=3600, refresh_token=None, scopes=[])
+        record = {
+            "user_id": 100,
+            "created_at": "2024-01-01T00:00:00Z",
+            "updated_at": "2024-01-01T00:00:00Z",
+            "start": "2024-01-01T00:00:00Z",
+            "timezone_offset": "-05:00",
+            "score_state": "SCORED",
+        }
+
+        with WhoopClientV2Sync(token_info=token_info) as client, aioresponses() as m:
+            m.get(
+                "https://api.prod.whoop.com/developer/v2/cycle?limit=25",
+                payload={"records": [{**record, "id": 1}, {**record, "id": 2}], "next_token": "token123"},
+            )
+            m.get(
+                "https://api.prod.whoop.com/developer/v2/cycle?limit=25&nextToken=token123",
+                payload={"records": [{**record, "id": 3}], "next_token": None},
+            )
+
+            items = client.cycles.iterate()
+            assert isinstance(items, Iterator)
+            assert next(items).id == 1
+            assert [cycle.id for cycle in items] == [2, 3]
+
+    def test_import_does_not_load_pandas(self):
+        """Test importing the sync client defers pandas until a DataFrame is requested."""
+        code = "import sys, whoopy.sync_wrapper; sys.exit('pandas' in sys.modules)"
+        subprocess.run([sys.executable, "-c", code], check=True, cwd=Path(__file__).resolve().parents[1])
@@ -3,10 +3,13 @@
 Copyright (c) 2024 Felix Geilert
 """
 
+import re
+
 import pytest
 from aioresponses import aioresponses
 
 from whoopy.client_v2 import WhoopClientV2
+from whoopy.exceptions import ResourceNotFoundError
 from whoopy.models.models_v2 import ScoreState
 from whoopy.utils import TokenInfo
 
@@ -56,6 +59,41 @@ class TestUserHandler:
                 assert measurements.weight_kilogram == 75.5
                 assert measurements.max_heart_rate == 190
 
+    @pytest.mark.asyncio
+    async def test_get_profile_and_measurements(self, client):
+        """Test fetching profile and body measurements together."""
+        async with client as whoop:
+            with aioresponses() as m:
+                m.get(
+                    "https://api.prod.whoop.com/developer/v2/user/profile/basic",
+                    payload={"user_id": 12345, "email": "test@example.com", "first_name": "John", "last_name": "Doe"},
+                )
+                m.get(
+                    "https://api.prod.whoop.com/developer/v2/user/measurement/body",
+                    payload={"height_meter": 1.80, "weight_kilogram": 75.5, "max_heart_rate": 190},
+                )
+
+                profile, measurements = await whoop.user.get_profile_and_measurements()
+
+                assert profile.user_id == 12345
+                assert measurements.max_heart_rate == 190
+
+    @pytest.mark.asyncio
+    async def test_get_profile_and_measurements_partial_failure(self, client):
+        """Test a failing endpoint is returned as an exception alongside the other result."""
+        async with client as whoop:
+            with aioresponses() as m:
+                m.get(
+                    "https://api.prod.whoop.com/developer/v2/user/profile/basic",
+                    payload={"user_id": 12345, "email": "test@example.com", "first_name": "John", "last_name": "Doe"},
+                )
+                m.get("https://api.prod.whoop.com/developer/v2/user/measurement/body", status=404)
+
+                profile, measurements = await whoop.user.get_profile_and_measurements(return_exceptions=True)
+
+                assert profile.user_id == 12345
+                assert isinstance(measurements, ResourceNotFoundError)
+
 
 class TestCycleHandler:
     """Test CycleHandler functionality."""
@@ -153,6 +191,79 @@ class TestCycleHandler:
                 assert cycles[1].id == 2
                 assert cycles[2].id == 3
 
+                # Iterate re-fetches the same pages, prefetching the second one
+                m.get("https://api.prod.whoop.com/developer/v2/cycle?limit=25", payload=page1_data)
+                m.get("https://api.prod.whoop.com/developer/v2/cycle?limit=25&nextToken=token123", payload=page2_data)
+
+                cycle_ids = [cycle.id async for cycle in whoop.cycles.iterate()]
+                assert cycle_ids == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_get_cycle_collection_concurrent(self, client):
+        """Test fetching date sub-ranges concurrently and merging them newest first."""
+
+        def cycle(cycle_id, day):
+            return {
+                "id": cycle_id,
+                "user_id": 100,
+                "created_at": f"2024-01-0{day}T00:00:00Z",
+                "updated_at": f"2024-01-0{day}T00:00:00Z",
+                "start": f"2024-01-0{day}T00:00:00Z",
+                "timezone_offset": "-05:00",
+                "score_state": "SCORED",
+            }
+
+        async with client as whoop:
+            with aioresponses() as m:
+                # Cycle 2 overlaps both windows and is returned twice
+                m.get(
+                    re.compile(r".*/cycle\?.*start=2024-01-02.*"),
+                    payload={"records": [cycle(3, 3), cycle(2, 2)], "next_token": None},
+                )
+                m.get(
+                    re.compile(r".*/cycle\?.*start=2024-01-01.*"),
+                    payload={"records": [cycle(2, 2), cycle(1, 1)], "next_token": None},
+                )
+
+                cycles = await whoop.cycles.get_all(
+                    start="2024-01-01T00:00:00Z", end="2024-01-03T00:00:00Z", concurrency=2
+                )
+
+                assert [c.id for c in cycles] == [3, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_get_cycle_collection_concurrent_dedupes_by_id(self, client):
+        """Test a record that changed between window fetches is only returned once."""
+        record = {
+            "id": 2,
+            "user_id": 100,
+            "created_at": "2024-01-02T00:00:00Z",
+            "start": "2024-01-02T00:00:00Z",
+            "timezone_offset": "-05:00",
+            "score_state": "PENDING_SCORE",
+        }
+
+        async with client as whoop:
+            with aioresponses() as m:
+                m.get(
+                    re.compile(r".*/cycle\?.*start=2024-01-02.*"),
+                    payload={"records": [{**record, "updated_at": "2024-01-02T00:00:00Z"}], "next_token": None},
+                )
+                m.get(
+                    re.compile(r".*/cycle\?.*start=2024-01-01.*"),
+                    payload={
+                        "records": [{**record, "updated_at": "2024-01-02T09:00:00Z", "score_state": "SCORED"}],
+                        "next_token": None,
+                    },
+                )
+
+                cycles = await whoop.cycles.get_all(
+                    start="2024-01-01T00:00:00Z", end="2024-01-03T00:00:00Z", concurrency=2
+                )
+
+                assert len(cycles) == 1
+                assert cycles[0].score_state == ScoreState.PENDING_SCORE
+
     @pytest.mark.asyncio
     async def test_get_sleep_for_cycle(self, client):
         """Test getting sleep for a specific cycle."""
@@ -3,9 +3,13 @@
 Copyright (c) 2024 Felix Geilert
 """
 
+import io
 from datetime import datetime, timezone
 from uuid import UUID
 
+import pytest
+from pydantic import ValidationError
+
 from whoopy.models.models_v2 import (
     Cycle,
     CycleScore,
@@ -20,6 +24,8 @@ from whoopy.models.models_v2 import (
     WorkoutScore,
     WorkoutV2,
     ZoneDurations,
+    models_to_dataframe,
+    models_to_polars,
 )
 
 
@@ -43,6 +49,16 @@ class TestUserModels:
         assert measurement.weight_kilogram == 75.5
         assert measurement.max_heart_rate == 190
 
+    def test_models_are_frozen(self):
+        """Test that API records are immutable and hashable."""
+        measurement = UserBodyMeasurement(height_meter=1.80, weight_kilogram=75.5, max_heart_rate=190)
+
+        with pytest.raises(ValidationError):
+            measurement.max_heart_rate = 200  # type: ignore[misc]
+        assert hash(measurement) == hash(
+            UserBodyMeasurement(height_meter=1.80, weight_kilogram=75.5, max_heart_rate=190)
+        )
+
 
 class TestCycleModels:
     """Test cycle-related models."""
@@ -193,6 +209,60 @@ class TestRecoveryModels:
         assert recovery.sleep_id == sleep_id
         assert recovery.score.recovery_score == 80.0
 
+    def test_recovery_dataframe(self):
+        """Test converting recoveries to a flattened DataFrame."""
+        now = datetime.now(timezone.utc)
+        recoveries = [
+            Recovery(
+                cycle_id=cycle_id,
+                sleep_id=UUID("12345678-1234-5678-1234-567812345678"),
+                user_id=67890,
+                created_at=now,
+                updated_at=now,
+                score_state=ScoreState.SCORED,
+                score=RecoveryScore(
+                    user_calibrating=False, recovery_score=80.0, resting_heart_rate=60.0, hrv_rmssd_milli=50.0
+                ),
+            )
+            for cycle_id in (1, 2)
+        ]
+
+        df = models_to_dataframe(recoveries)
+
+        assert df.shape[0] == 2
+        assert list(df["cycle_id"]) == [1, 2]
+        assert list(df["score.recovery_score"]) == [80.0, 80.0]
+        assert str(df["created_at"].dtype).startswith("datetime64")
+
+    def test_recovery_polars(self):
+        """Test converting recoveries to a Polars DataFrame with the same column names."""
+        pl = pytest.importorskip("polars")
+        now = datetime.now(timezone.utc)
+        recoveries = [
+            Recovery(
+                cycle_id=cycle_id,
+                sleep_id=UUID("12345678-1234-5678-1234-567812345678"),
+                user_id=67890,
+                created_at=now,
+                updated_at=now,
+                score_state=ScoreState.SCORED,
+                score=RecoveryScore(
+                    user_calibrating=False, recovery_score=80.0, resting_heart_rate=60.0, hrv_rmssd_milli=50.0
+                ),
+            )
+            for cycle_id in (1, 2)
+        ]
+
+        df = models_to_polars(recoveries)
+
+        assert df.shape[0] == 2
+        assert df["cycle_id"].to_list() == [1, 2]
+        assert df["score.recovery_score"].to_list() == [80.0, 80.0]
+        assert df.schema["created_at"] == pl.Datetime("us", "UTC")
+        assert df["sleep_id"].to_list() == ["12345678-1234-5678-1234-567812345678"] * 2
+        assert pl.Object not in df.schema.dtypes()
+        df.write_parquet(io.BytesIO())
+
 
 class TestWorkoutModels:
     """Test workout-related models."""
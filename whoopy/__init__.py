@@ -1,52 +1,108 @@
 __version__ = "0.3.0"
 
 import logging
-from typing import Any
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
 
-# Import v1 for backward compatibility
-try:
-    from . import handlers as _handlers_v1  # noqa: F401
-    from . import models as _models_v1  # noqa: F401
-    from .client_v1 import API_VERSION as API_VERSION_V1
+if TYPE_CHECKING:
+    from .client_v1 import API_VERSION as API_VERSION_V1  # noqa: F401
     from .client_v1 import WhoopClient as WhoopClientV1
-    from .models.models_v1 import SPORT_IDS as SPORT_IDS_V1
-
-    v1_available = True
-except Exception as ex:
-    logging.error(f"Error importing whoopy v1: {ex}")
-    v1_available = False
-    WhoopClientV1 = None  # type: ignore[misc,assignment]
-    API_VERSION_V1 = "1"
-    SPORT_IDS_V1 = {}
-
-# Import v2 as the new default
-WhoopClient: Any
-WhoopClientV2: Any | None = None
-WhoopClientV2Sync: Any | None = None
-API_VERSION: str
-SPORT_IDS: dict[int, str]
-
-try:
     from .client_v2 import WhoopClientV2
+    from .models.models_v1 import SPORT_IDS as SPORT_IDS_V1  # noqa: F401
     from .models.models_v2 import SPORT_IDS
     from .sync_wrapper import WhoopClientV2Sync
 
+    WhoopClient: Any
+    API_VERSION: str
+    v1_available: bool
+    v2_available: bool
+
+# Clients are imported lazily on first attribute access (PEP 562), so `import whoopy`
+# does not pay for aiohttp, pandas, pydantic and both API versions up front.
+
+
+def _load_v1() -> dict[str, Any]:
+    """Import v1 for backward compatibility."""
+    try:
+        from .client_v1 import API_VERSION as api_version_v1
+        from .client_v1 import WhoopClient as client_v1
+        from .models.models_v1 import SPORT_IDS as sport_ids_v1
+    except Exception as ex:
+        logging.error("Error importing whoopy v1: %s", ex)
+        return {"v1_available": False, "WhoopClientV1": None, "API_VERSION_V1": "1", "SPORT_IDS_V1": {}}
+
+    return {
+        "v1_available": True,
+        "WhoopClientV1": client_v1,
+        "API_VERSION_V1": api_version_v1,
+        "SPORT_IDS_V1": sport_ids_v1,
+    }
+
+
+def _load_v2() -> dict[str, Any]:
+    """Import v2 as the new default, falling back to v1 if v2 is unavailable."""
+    try:
+        from .client_v2 import WhoopClientV2 as client_v2
+        from .models.models_v2 import SPORT_IDS as sport_ids_v2
+        from .sync_wrapper import WhoopClientV2Sync as client_v2_sync
+    except Exception as ex:
+        logging.error("Error importing whoopy v2: %s", ex)
+        v1 = _resolve(_load_v1)
+        if not v1["v1_available"]:
+            # Neither v1 nor v2 available
+            raise ImportError("Unable to import any version of WhoopClient") from ex
+
+        return {
+            "v2_available": False,
+            "WhoopClientV2": None,
+            "WhoopClientV2Sync": None,
+            "WhoopClient": v1["WhoopClientV1"],
+            "API_VERSION": v1["API_VERSION_V1"],
+            "SPORT_IDS": v1["SPORT_IDS_V1"],
+        }
+
     # Make v2 sync wrapper the default
-    WhoopClient = WhoopClientV2Sync
-    API_VERSION = "2"
-    v2_available = True
-
-except Exception as ex:
-    logging.error(f"Error importing whoopy v2: {ex}")
-    v2_available = False
-    # Fall back to v1 if v2 fails and v1 is available
-    if v1_available:
-        WhoopClient = WhoopClientV1
-        API_VERSION = API_VERSION_V1
-        SPORT_IDS = SPORT_IDS_V1
-    else:
-        # Neither v1 nor v2 available
-        raise ImportError("Unable to import any version of WhoopClient") from ex
+    return {
+        "v2_available": True,
+        "WhoopClientV2": client_v2,
+        "WhoopClientV2Sync": client_v2_sync,
+        "WhoopClient": client_v2_sync,
+        "API_VERSION": "2",
+        "SPORT_IDS": sport_ids_v2,
+    }
+
+
+_LAZY_LOADERS: dict[str, Callable[[], dict[str, Any]]] = {
+    "v1_available": _load_v1,
+    "WhoopClientV1": _load_v1,
+    "API_VERSION_V1": _load_v1,
+    "SPORT_IDS_V1": _load_v1,
+    "v2_available": _load_v2,
+    "WhoopClient": _load_v2,
+    "WhoopClientV2": _load_v2,
+    "WhoopClientV2Sync": _load_v2,
+    "API_VERSION": _load_v2,
+    "SPORT_IDS": _load_v2,
+}
+
+
+def _resolve(loader: Callable[[], dict[str, Any]]) -> dict[str, Any]:
+    """Run a loader and cache its names on the module so later lookups bypass __getattr__."""
+    values = loader()
+    globals().update(values)
+    return values
+
+
+def __getattr__(name: str) -> Any:
+    loader = _LAZY_LOADERS.get(name)
+    if loader is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _resolve(loader)[name]
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_LOADERS))
+
 
 # Export all available clients
 __all__ = [
@@ -58,10 +114,3 @@ __all__ = [
     "WhoopClientV2Sync",  # Explicit sync v2
     "__version__",
 ]
-
-try:
-    # import other versions
-    from . import client_v1 as _client_v1  # noqa: F401
-    from . import client_vu7 as _client_vu7  # noqa: F401
-except Exception as ex:
-    logging.error(f"Not all dependencies installed: {ex}")
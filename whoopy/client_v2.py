@@ -9,12 +9,19 @@ Follows api docs: https://api.prod.whoop.com/developer/doc/openapi.json
 Copyright (c) 2024 Felix Geilert
 """
 
+import asyncio
+import copy
 import json
 import logging
 import os
-from typing import Any
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, ClassVar, NoReturn
 
 import aiohttp
+from yarl import URL
 
 from .constants import (
     HTTP_BAD_REQUEST,
@@ -31,20 +38,93 @@ from .exceptions import (
     RefreshTokenError,
     ResourceNotFoundError,
     ServerError,
+    SessionClosedError,
     TokenExpiredError,
     ValidationError,
     WhoopException,
 )
 from .handlers import handlers_v2 as handlers
 from .utils import OAuth2Helper, RequestThrottler, RetryableSession, RetryConfig, TokenInfo
+from .utils.auth import save_token_file
 
 API_VERSION = "2"
 API_BASE = "https://api.prod.whoop.com/"
 
+# Upper bound in seconds on server-provided Retry-After and rate limit reset waits, so a bogus
+# header cannot hold back requests indefinitely
+RETRY_AFTER_CAP = 3600
+
+# Handler attributes that only exist once the client's session has been opened
+_HANDLER_NAMES = frozenset({"cycles", "sleep", "recovery", "workouts", "user"})
+
+
+@lru_cache(maxsize=4)
+def _parse_config_file(path: str, mtime_ns: int) -> dict[str, Any]:  # noqa: ARG001
+    """Parse a config file; cached per (path, mtime) so unchanged files are not re-read."""
+    with open(path, "rb") as f:
+        config_data = json.load(f)
+
+    if not isinstance(config_data, dict):
+        raise ConfigurationError(f"Config file must contain a JSON object: {path}")
+    return config_data
+
+
+def _read_config_file(path: str, mtime_ns: int) -> dict[str, Any]:
+    """Get a parsed config file, as a copy so callers cannot mutate the cached data."""
+    return copy.deepcopy(_parse_config_file(path, mtime_ns))
+
+
+def _parse_retry_after(value: str | None) -> int | None:
+    """Parse a Retry-After header given either as delay seconds or as an HTTP date, capped at RETRY_AFTER_CAP."""
+    if not value:
+        return None
+    if value.isdigit():
+        return min(int(value), RETRY_AFTER_CAP)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        # A "-0000" zone yields a naive datetime; HTTP dates are always UTC
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return min(max(0, int((retry_at - datetime.now(timezone.utc)).total_seconds())), RETRY_AFTER_CAP)
+
 
 class WhoopClientV2:
     """Async client for Whoop API v2."""
 
+    __slots__ = (
+        "_auth_header",
+        "_base_url",
+        "_oauth_helper",
+        "_refresh_lock",
+        "_retry_session",
+        "_session",
+        "_throttler",
+        "auto_refresh_token",
+        "client_id",
+        "client_secret",
+        "cycles",
+        "logger",
+        "max_concurrent_requests",
+        "max_requests_per_minute",
+        "recovery",
+        "redirect_uri",
+        "request_delay",
+        "retry_config",
+        "sleep",
+        "token_info",
+        "user",
+        "workouts",
+    )
+
+    # API handlers, assigned when the session is opened (see __getattr__ for access before that)
+    cycles: handlers.CycleHandler
+    sleep: handlers.SleepHandler
+    recovery: handlers.RecoveryHandler
+    workouts: handlers.WorkoutHandler
+    user: handlers.UserHandler
+
     def __init__(
         self,
         token_info: TokenInfo | None = None,
@@ -56,6 +136,7 @@ class WhoopClientV2:
         logger: logging.Logger | None = None,
         request_delay: float = 0.0,
         max_concurrent_requests: int = 10,
+        max_requests_per_minute: int | None = None,
     ):
         """
         Initialize the Whoop API v2 client.
@@ -70,6 +151,7 @@ class WhoopClientV2:
             logger: Logger instance (creates default if None)
             request_delay: Delay in seconds between requests (default: 0)
             max_concurrent_requests: Maximum concurrent requests (default: 10)
+            max_requests_per_minute: Token-bucket rate limit allowing bursts up to this size (default: None)
         """
         self.token_info = token_info
         self.client_id = client_id
@@ -80,13 +162,27 @@ class WhoopClientV2:
         self.logger = logger or logging.getLogger("whoopy")
         self.request_delay = request_delay
         self.max_concurrent_requests = max_concurrent_requests
+        self.max_requests_per_minute = max_requests_per_minute
+
+        # Parsed once so each request joins its path onto a ready URL instead of re-parsing a string
+        self._base_url = URL(f"{API_BASE}developer/v{API_VERSION}")
 
         # Session will be created in __aenter__
         self._session: aiohttp.ClientSession | None = None
         self._retry_session: RetryableSession | None = None
 
+        # Authorization header for the current token, rebuilt only when the token changes
+        self._auth_header: str | None = None
+
+        # Serializes token refreshes so concurrent 401s trigger a single refresh
+        self._refresh_lock = asyncio.Lock()
+
         # Request throttler
-        self._throttler = RequestThrottler(delay=self.request_delay, max_concurrent=self.max_concurrent_requests)
+        self._throttler = RequestThrottler(
+            delay=self.request_delay,
+            max_concurrent=self.max_concurrent_requests,
+            rate_limit=self.max_requests_per_minute,
+        )
 
         # OAuth helper
         if client_id and client_secret:
@@ -96,67 +192,36 @@ class WhoopClientV2:
         else:
             self._oauth_helper = None  # type: ignore[assignment]
 
-        # API handlers (will be initialized after session is created)
-        self._cycles: handlers.CycleHandler | None = None
-        self._sleep: handlers.SleepHandler | None = None
-        self._recovery: handlers.RecoveryHandler | None = None
-        self._workouts: handlers.WorkoutHandler | None = None
-        self._user: handlers.UserHandler | None = None
-
     @property
     def base_url(self) -> str:
         """Get the base URL for API requests."""
-        return f"{API_BASE}developer/v{API_VERSION}"
+        return str(self._base_url)
 
     @property
     def session(self) -> aiohttp.ClientSession:
         """Get the HTTP session."""
         if self._session is None:
-            raise RuntimeError("Client session not initialized. Use 'async with' context manager.")
+            raise SessionClosedError()
+        if self._session.closed:
+            raise SessionClosedError("Client session is closed")
         return self._session
 
     @property
     def retry_session(self) -> RetryableSession:
         """Get the retry-enabled session."""
         if self._retry_session is None:
-            raise RuntimeError("Client session not initialized. Use 'async with' context manager.")
+            raise SessionClosedError()
+        if self._session is not None and self._session.closed:
+            raise SessionClosedError("Client session is closed")
         return self._retry_session
 
-    # Handler properties
-    @property
-    def cycles(self) -> handlers.CycleHandler:
-        """Get the cycles handler."""
-        if self._cycles is None:
-            raise RuntimeError("Client not initialized. Use 'async with' context manager.")
-        return self._cycles
-
-    @property
-    def sleep(self) -> handlers.SleepHandler:
-        """Get the sleep handler."""
-        if self._sleep is None:
-            raise RuntimeError("Client not initialized. Use 'async with' context manager.")
-        return self._sleep
-
-    @property
-    def recovery(self) -> handlers.RecoveryHandler:
-        """Get the recovery handler."""
-        if self._recovery is None:
-            raise RuntimeError("Client not initialized. Use 'async with' context manager.")
-        return self._recovery
+    if not TYPE_CHECKING:  # keep attribute typos visible to type checkers
 
-    @property
-    def workouts(self) -> handlers.WorkoutHandler:
-        """Get the workouts handler."""
-        if self._workouts is None:
-            raise RuntimeError("Client not initialized. Use 'async with' context manager.")
-        return self._workouts
-
-    @property
-    def user(self) -> handlers.UserHandler:
-        """Get the user handler."""
-        if self._user is None:
-            raise RuntimeError("Client not initialized. Use 'async with' context manager.")
-        return self._user
+        def __getattr__(self, name: str) -> Any:
+            # Only reached for unset slots, i.e. handlers accessed before the session was opened
+            if name in _HANDLER_NAMES:
+                raise SessionClosedError("Client not initialized. Use 'async with' context manager.")
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
 
     async def __aenter__(self) -> "WhoopClientV2":
         """Enter async context manager."""
@@ -185,28 +250,48 @@ class WhoopClientV2:
                 self.logger.info("Token refreshed successfully")
             except Exception as e:
                 # Log but don't fail - let the first API call handle auth errors
-                self.logger.warning(f"Failed to refresh expired token: {e}")
+                self.logger.warning("Failed to refresh expired token: %s", e)
+
+        # exchange_code leaves the session it authorized over open; keep using it
+        if self._session is None or self._session.closed:
+            self._open_session()
+        else:
+            self._update_auth_header()
+
+        return self
 
+    def _open_session(self) -> None:
+        """Create the HTTP session, retry wrapper and API handlers."""
         # Create session with proper headers
         headers = {
             "User-Agent": "Whoopy/0.3.0 (Python Whoop API Client)",
             "Accept": "application/json",
         }
 
-        if self.token_info:
-            headers["Authorization"] = f"{self.token_info.token_type} {self.token_info.access_token}"
-
-        self._session = aiohttp.ClientSession(headers=headers)
-        self._retry_session = RetryableSession(self._session, self.retry_config, self.check_response)
+        self._update_auth_header()
+        if self._auth_header:
+            headers["Authorization"] = self._auth_header
+
+        # All requests go to a single host, so size the per-host pool to the request concurrency
+        # and cache DNS lookups; concurrent calls then multiplex over warm keep-alive connections.
+        # Idle connections are kept for a minute so paced requests (request_delay, rate limits)
+        # still find a warm TLS connection instead of paying for a new handshake.
+        connector = aiohttp.TCPConnector(
+            limit_per_host=self.max_concurrent_requests,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+        )
+        self._session = aiohttp.ClientSession(headers=headers, connector=connector)
+        self._retry_session = RetryableSession(
+            self._session, self.retry_config, self.check_response, in_flight=self._throttler.in_flight
+        )
 
         # Initialize handlers
-        self._cycles = handlers.CycleHandler(self)
-        self._sleep = handlers.SleepHandler(self)
-        self._recovery = handlers.RecoveryHandler(self)
-        self._workouts = handlers.WorkoutHandler(self)
-        self._user = handlers.UserHandler(self)
-
-        return self
+        self.cycles = handlers.CycleHandler(self)
+        self.sleep = handlers.SleepHandler(self)
+        self.recovery = handlers.RecoveryHandler(self)
+        self.workouts = handlers.WorkoutHandler(self)
+        self.user = handlers.UserHandler(self)
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Exit async context manager."""
@@ -224,39 +309,20 @@ class WhoopClientV2:
             Various WhoopException subclasses based on status code
         """
         if response.status == HTTP_OK:
+            self._observe_rate_limit(response)
             return
 
-        # Try to get error details from response
+        # Try to get error details from response, reading the body only once
+        raw = await response.read()
         try:
-            error_data = await response.json()
-        except Exception:
-            error_data = await response.text()
+            error_data = json.loads(raw)
+        except ValueError:
+            error_data = raw.decode("utf-8", "replace")
 
         # Map status codes to exceptions
-        if response.status == HTTP_BAD_REQUEST:
-            raise ValidationError(
-                message="Bad request",
-                validation_errors=error_data if isinstance(error_data, dict) else None,
-                details={"status": HTTP_BAD_REQUEST, "response": error_data},
-            )
-        if response.status == HTTP_UNAUTHORIZED:
-            if self.auto_refresh_token and self.token_info and self.token_info.refresh_token:
-                # Token might be expired, try to refresh
-                raise TokenExpiredError(details={"status": HTTP_UNAUTHORIZED, "response": error_data})
-            raise AuthenticationError(details={"status": HTTP_UNAUTHORIZED, "response": error_data})
-        if response.status == HTTP_NOT_FOUND:
-            raise ResourceNotFoundError(
-                resource_type="Resource", details={"status": HTTP_NOT_FOUND, "response": error_data}
-            )
-        if response.status == HTTP_TOO_MANY_REQUESTS:
-            retry_after = response.headers.get("Retry-After")
-            self.logger.warning(f"Rate limit hit. Retry-After: {retry_after}")
-            # Adjust throttler delay when we hit rate limits
-            self._throttler.adjust_delay(factor=2.0)
-            raise RateLimitError(
-                retry_after=int(retry_after) if retry_after else None,
-                details={"status": HTTP_TOO_MANY_REQUESTS, "response": error_data},
-            )
+        handler = self._STATUS_HANDLERS.get(response.status)
+        if handler is not None:
+            handler(self, response, error_data)
         if response.status >= HTTP_INTERNAL_SERVER_ERROR:
             raise ServerError(
                 status_code=response.status,
@@ -267,12 +333,82 @@ class WhoopClientV2:
             f"Unexpected status code: {response.status}", details={"status": response.status, "response": error_data}
         )
 
-    async def refresh_token(self) -> None:
+    def _raise_bad_request(self, response: aiohttp.ClientResponse, error_data: Any) -> NoReturn:  # noqa: ARG002
+        """Raise ValidationError for a 400 response."""
+        raise ValidationError(
+            message="Bad request",
+            validation_errors=error_data if isinstance(error_data, dict) else None,
+            details={"status": HTTP_BAD_REQUEST, "response": error_data},
+        )
+
+    def _raise_unauthorized(self, response: aiohttp.ClientResponse, error_data: Any) -> NoReturn:  # noqa: ARG002
+        """Raise TokenExpiredError if the token can be refreshed, else AuthenticationError."""
+        if self.auto_refresh_token and self.token_info and self.token_info.refresh_token:
+            # Token might be expired, try to refresh
+            raise TokenExpiredError(details={"status": HTTP_UNAUTHORIZED, "response": error_data})
+        raise AuthenticationError(details={"status": HTTP_UNAUTHORIZED, "response": error_data})
+
+    def _raise_not_found(self, response: aiohttp.ClientResponse, error_data: Any) -> NoReturn:  # noqa: ARG002
+        """Raise ResourceNotFoundError for a 404 response."""
+        raise ResourceNotFoundError(
+            resource_type="Resource", details={"status": HTTP_NOT_FOUND, "response": error_data}
+        )
+
+    def _raise_rate_limited(self, response: aiohttp.ClientResponse, error_data: Any) -> NoReturn:
+        """Slow down future requests and raise RateLimitError for a 429 response."""
+        retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+        self.logger.warning("Rate limit hit. Retry-After: %s", retry_after)
+        # Adjust throttler delay when we hit rate limits
+        self._throttler.adjust_delay(factor=2.0)
+        raise RateLimitError(
+            retry_after=retry_after,
+            details={"status": HTTP_TOO_MANY_REQUESTS, "response": error_data},
+        )
+
+    # Error status codes with a dedicated exception; other 5xx map to ServerError
+    _STATUS_HANDLERS: ClassVar[dict[int, Callable[["WhoopClientV2", aiohttp.ClientResponse, Any], NoReturn]]] = {
+        HTTP_BAD_REQUEST: _raise_bad_request,
+        HTTP_UNAUTHORIZED: _raise_unauthorized,
+        HTTP_NOT_FOUND: _raise_not_found,
+        HTTP_TOO_MANY_REQUESTS: _raise_rate_limited,
+    }
+
+    def _observe_rate_limit(self, response: aiohttp.ClientResponse) -> None:
+        """Pause new requests until the window resets once the quota is used up, instead of waiting for a 429."""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset = response.headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None or remaining.strip() != "0":
+            return
+
+        try:
+            reset_seconds = min(float(reset), RETRY_AFTER_CAP)
+        except ValueError:
+            return
+
+        self.logger.info("Rate limit quota exhausted, pausing requests for %ss", reset_seconds)
+        self._throttler.pause(reset_seconds)
+
+    def _update_auth_header(self) -> None:
+        """Cache the Authorization header for the current token and apply it to the open session."""
+        if self.token_info is None:
+            self._auth_header = None
+            return
+
+        self._auth_header = f"{self.token_info.token_type} {self.token_info.access_token}"
+        if self._session is not None:
+            self._session.headers["Authorization"] = self._auth_header
+
+    async def refresh_token(self, force: bool = False) -> None:
         """
         Refresh the access token using the refresh token.
 
         This method uses the stored refresh token to obtain a new access token
         from the Whoop OAuth2 endpoint. The token info is automatically updated.
+        A token with more than a minute of lifetime left is kept as is unless
+        ``force`` is set.
+
+        Args:
+            force: Refresh even if the current token has not expired yet (default: False)
 
         Raises:
             ConfigurationError: If OAuth helper not configured (missing client_id/secret)
@@ -281,18 +417,29 @@ class WhoopClientV2:
         if not self._oauth_helper:
             raise ConfigurationError("Cannot refresh token without client_id and client_secret")
 
-        if not self.token_info or not self.token_info.refresh_token:
-            raise RefreshTokenError("No refresh token available")
+        if not force and self.token_info and self.token_info.time_until_expiry > timedelta(seconds=60):
+            return
 
-        try:
-            self.token_info = await self._oauth_helper.refresh_access_token(self.session, self.token_info.refresh_token)
+        stale_access_token = self.token_info.access_token if self.token_info else None
 
-            # Update session headers with new token
-            if self._session:
-                self._session.headers["Authorization"] = f"{self.token_info.token_type} {self.token_info.access_token}"
+        async with self._refresh_lock:
+            # Another request already refreshed the token while this one waited
+            if self.token_info and self.token_info.access_token != stale_access_token:
+                return
 
-        except Exception as e:
-            raise RefreshTokenError(f"Failed to refresh token: {e!s}") from e
+            if not self.token_info or not self.token_info.refresh_token:
+                raise RefreshTokenError("No refresh token available")
+
+            try:
+                self.token_info = await self._oauth_helper.refresh_access_token(
+                    self.session, self.token_info.refresh_token
+                )
+
+                # Update session headers with new token
+                self._update_auth_header()
+
+            except Exception as e:
+                raise RefreshTokenError(f"Failed to refresh token: {e!s}") from e
 
     async def request(
         self,
@@ -317,24 +464,25 @@ class WhoopClientV2:
         Returns:
             The response object
         """
-        url = f"{self.base_url}/{path}"
+        url = self._base_url / path
 
         # Apply throttling
         async with self._throttler:
-            self.logger.debug(f"Request: {method} {url} params={params}")
+            self.logger.debug("Request: %s %s params=%s", method, url, params)
 
             # Try the request
             try:
                 response = await self.retry_session.request(method, url, params=params, json=json_data, **kwargs)
-                self.logger.debug(f"Response: {response.status} for {method} {url}")
+                self.logger.debug("Response: %s for %s %s", response.status, method, url)
                 return response  # type: ignore[no-any-return]
 
             except TokenExpiredError:
                 self.logger.info("Token expired during request, refreshing and retrying")
                 # Try to refresh token and retry once
-                await self.refresh_token()
+                # The server rejected the token, so refresh regardless of its expiry time
+                await self.refresh_token(force=True)
                 response = await self.retry_session.request(method, url, params=params, json=json_data, **kwargs)
-                self.logger.debug(f"Retry response: {response.status} for {method} {url}")
+                self.logger.debug("Retry response: %s for %s %s", response.status, method, url)
                 return response  # type: ignore[no-any-return]
 
     # Authentication methods
@@ -357,40 +505,64 @@ class WhoopClientV2:
             scopes: List of scopes to request
             open_browser: Whether to open the authorization URL in browser
 
+        The code is exchanged over a short-lived session, so the client's ``async with`` block
+        opens a fresh connection. To authorize and make requests over a single connection, build
+        the client yourself, call `exchange_code` and then enter its ``async with`` block.
+
         Returns:
-            Authenticated WhoopClientV2 instance
+            Authenticated WhoopClientV2 instance. No session is left open; use it with
+            ``async with`` to make requests.
         """
         oauth_helper = OAuth2Helper(
             client_id=client_id, client_secret=client_secret, redirect_uri=redirect_uri, scopes=scopes
         )
 
-        # Get authorization URL
-        auth_url = oauth_helper.get_authorization_url()
+        # The prompt blocks on input(), so keep it off the event loop
+        code = await asyncio.to_thread(oauth_helper.prompt_for_code, open_browser)
 
-        if open_browser:
-            print(f"Opening browser to: {auth_url}")
-            oauth_helper.open_authorization_url()
-        else:
-            print(f"Visit this URL to authorize: {auth_url}")
+        # Exchange code for token; callers need not enter the client's context, so the exchange
+        # uses a short-lived session rather than leaving the client's own session open
+        async with aiohttp.ClientSession() as session:
+            token_info = await oauth_helper.exchange_code_for_token(session, code)
 
-        # Get authorization code from user
-        print(f"\nAfter authorization, you'll be redirected to: {redirect_uri}")
-        redirect_url = input("Paste the full redirect URL here: ").strip()
+        client = cls(token_info=token_info, client_id=client_id, client_secret=client_secret, redirect_uri=redirect_uri)
+        client._oauth_helper = oauth_helper
+        return client
 
-        # Extract code from redirect URL
-        from urllib.parse import parse_qs, urlparse
+    async def exchange_code(self, code: str, oauth_helper: OAuth2Helper | None = None) -> None:
+        """
+        Exchange an authorization code for a token over this client's own session.
 
-        parsed = urlparse(redirect_url)
-        code = parse_qs(parsed.query).get("code", [None])[0]
+        This is the supported way to authorize and make requests over a single connection (the
+        sync wrapper's ``auth_flow`` uses it). The session is opened if needed and stays open
+        afterwards, so the first API requests reuse the connection; it is closed by the client's
+        ``async with`` block (or ``__aexit__``), which must therefore follow::
 
-        if not code:
-            raise AuthenticationError("No authorization code found in redirect URL")
+            client = WhoopClientV2(client_id=..., client_secret=...)
+            await client.exchange_code(code)
+            async with client:
+                profile = await client.user.get_profile()
 
-        # Exchange code for token
-        async with aiohttp.ClientSession() as session:
-            token_info = await oauth_helper.exchange_code_for_token(session, code)
+        Args:
+            code: Authorization code from the OAuth2 redirect
+            oauth_helper: OAuth2 helper to use (default: the one built from client_id/client_secret)
 
-        return cls(token_info=token_info, client_id=client_id, client_secret=client_secret, redirect_uri=redirect_uri)
+        Raises:
+            ConfigurationError: If no OAuth2 helper is available
+        """
+        if oauth_helper is not None:
+            self._oauth_helper = oauth_helper
+        if self._oauth_helper is None:
+            raise ConfigurationError("client_id and client_secret are required to exchange an authorization code")
+
+        if self._session is None or self._session.closed:
+            self._open_session()
+        try:
+            self.token_info = await self._oauth_helper.exchange_code_for_token(self.session, code)
+        except BaseException:
+            await self.__aexit__(None, None, None)
+            raise
+        self._update_auth_header()
 
     @classmethod
     def from_token(
@@ -439,15 +611,15 @@ class WhoopClientV2:
         Returns:
             WhoopClientV2 instance
         """
-        # Load config
-        if not os.path.exists(config_path):
-            raise ConfigurationError(f"Config file not found: {config_path}")
+        # Load config (re-parsed only when the file changes)
+        try:
+            mtime_ns = os.stat(config_path).st_mtime_ns
+        except FileNotFoundError as e:
+            raise ConfigurationError(f"Config file not found: {config_path}") from e
 
-        with open(config_path) as f:
-            config_data = json.load(f)
+        config_data = _read_config_file(os.path.abspath(config_path), mtime_ns)
 
         # Handle both flat and nested config structures
-        assert isinstance(config_data, dict)
         config = config_data.get("whoop", config_data)
 
         client_id = config.get("client_id")
@@ -479,10 +651,4 @@ class WhoopClientV2:
         if not self.token_info:
             raise ValueError("No token to save")
 
-        if self._oauth_helper:
-            self._oauth_helper.save_token(self.token_info, path)
-        else:
-            # Save manually
-            os.makedirs(os.path.dirname(path), exist_ok=True)
-            with open(path, "w") as f:
-                json.dump(self.token_info.to_dict(), f, indent=2)
+        save_token_file(self.token_info, path)
@@ -516,7 +516,7 @@ class WhoopClient:
                     hr_vals = self.pull_api(self._create_url("metrics/heart_rate"), params=params)["values"]
                 except OSError:
                     print(f"Unable to pull data from {dates[0]} to {dates[1]}")
-                    logging.warning(f"Unable to pull data from {dates[0]} to {dates[1]}")
+                    logging.warning("Unable to pull data from %s to %s", dates[0], dates[1])
                     continue
                 hr_values = [
                     [
@@ -1 +1,479 @@
+"""Example script demonstrating how to use the Whoopy library.
 
+This script shows how to authenticate with the Whoop API and retrieve
+various types of data including cycles, sleep, recovery, and workouts.
+
+To run this example:
+    uv run python -m whoopy.example
+
+Copyright (c) 2024 Felix Geilert
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import traceback
+from collections.abc import Awaitable
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import polars as pl
+except ImportError:  # pragma: no cover - optional dependency
+    pl = None  # type: ignore[assignment]
+
+from whoopy import WhoopClient, WhoopClientV2
+from whoopy.exceptions import AuthenticationError, RateLimitError, ResourceNotFoundError, SessionClosedError
+from whoopy.utils import OAuth2Helper
+
+
+def configure_logging(verbose: bool = False) -> None:
+    """Configure logging based on verbosity level."""
+
+    # Set logging level based on verbosity
+    level = logging.DEBUG if verbose else logging.WARNING
+    logging.basicConfig(level=level, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    # Set specific loggers
+    logging.getLogger("whoopy").setLevel(level)
+    logging.getLogger("aiohttp").setLevel(logging.WARNING)  # Always quiet for aiohttp
+    logging.getLogger("urllib3").setLevel(logging.WARNING)  # Always quiet for urllib3
+
+
+_HERE = Path(__file__).resolve().parent
+BASE_CONFIG_PATH = _HERE.parent / "config.json"
+
+
+def load_config(config_path: str | Path | None = None) -> dict[str, Any]:
+    """Load configuration from JSON file."""
+    if config_path is None:
+        config_path = BASE_CONFIG_PATH
+    print(f"Loading config from {config_path}")
+
+    if not Path(config_path).is_file():
+        print(f"Config file not found: {config_path}")
+        print("\nPlease create a config.json file with the following structure:")
+        print(
+            json.dumps(
+                {
+                    "client_id": "your_client_id",
+                    "client_secret": "your_client_secret",
+                    "redirect_uri": "http://localhost:1234",
+                },
+                indent=2,
+            )
+        )
+        raise FileNotFoundError(f"Config file not found: {config_path}")
+
+    with open(config_path, "rb") as f:
+        raw = f.read()
+        res = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        assert isinstance(res, dict)
+
+        # Handle both flat and nested config structures
+        if "whoop" in res:
+            # Nested structure (backward compatibility)
+            config = res["whoop"]
+            print("Note: Using nested config structure. Consider updating to flat structure.")
+        else:
+            # Flat structure (preferred)
+            config = res
+
+        return config  # type: ignore[no-any-return]
+
+
+def example_sync(verbose: bool = False) -> None:
+    """Example using the synchronous API (v2 with sync wrapper)."""
+    print("=== Synchronous Example (v2 API) ===\n")
+
+    # Configure logging for this example
+    configure_logging(verbose)
+
+    client = None
+    try:
+        # Load config first
+        config = load_config(BASE_CONFIG_PATH)
+
+        # Try to load token
+        oauth_helper = OAuth2Helper(client_id=config["client_id"], client_secret=config["client_secret"])
+        token_info = oauth_helper.load_token()
+
+        if token_info:
+            # Create client with existing token and throttling
+            client = WhoopClient(
+                token_info=token_info,
+                client_id=config["client_id"],
+                client_secret=config["client_secret"],
+                request_delay=0.2,  # 200ms between requests
+                max_concurrent_requests=3,  # Limit concurrent requests
+                logger=logging.getLogger("whoopy") if verbose else None,
+            )
+            if verbose:
+                print("Loaded client from saved credentials (verbose mode enabled)")
+            else:
+                print("Loaded client from saved credentials")
+        else:
+            raise Exception("No saved token - need to authenticate")
+
+        # Check if we actually have a token
+        if client.token_info is None:
+            print("No saved credentials found")
+            raise Exception("No saved token - need to authenticate")
+
+        print("Loaded client from saved credentials")
+
+        # Check if token needs refresh
+        if client.token_info.is_expired:
+            print("Token is expired, refreshing...")
+            try:
+                client.refresh_token()
+                client.save_token()
+                print("Token refreshed successfully")
+            except Exception as refresh_error:
+                print(f"Failed to refresh token: {refresh_error}")
+                print("Starting new OAuth flow...\n")
+                raise  # Re-raise to trigger OAuth flow
+
+    except Exception as e:
+        print(f"Could not load saved credentials: {e}")
+        print("Starting OAuth flow...\n")
+
+        # Load config and start OAuth flow
+        config = load_config()
+        client = WhoopClient.auth_flow(
+            client_id=config["client_id"],
+            client_secret=config["client_secret"],
+            redirect_uri=config.get("redirect_uri", "http://localhost:1234"),
+            open_browser=True,
+            request_delay=0.2,  # Apply throttling from the start
+            max_concurrent_requests=3,
+        )
+
+        # Save credentials for future use
+        client.save_token()
+        print("Saved credentials for future use")
+
+    # Use context manager to ensure proper cleanup
+    with client:
+        # Get user profile
+        print("\n--- User Profile ---")
+        # Both endpoints are independent, so fetch them concurrently; failures come back as
+        # exceptions so a measurements error does not discard the profile
+        try:
+            profile, measurements = client.user.get_profile_and_measurements(return_exceptions=True)
+        except SessionClosedError as e:
+            print(f"Failed to get user profile: {e}")
+            print("Session appears to be closed. This might be a client initialization issue.")
+            return
+
+        if isinstance(profile, BaseException):
+            print(f"Failed to get user profile: {profile}")
+            return
+
+        print(f"Name: {profile.first_name} {profile.last_name}")
+        print(f"Email: {profile.email}")
+        print(f"User ID: {profile.user_id}")
+
+        print("\n--- Body Measurements ---")
+        if isinstance(measurements, BaseException):
+            print(f"Failed to get body measurements: {measurements}")
+        else:
+            print(f"Height: {measurements.height_meter:.2f} m")
+            print(f"Weight: {measurements.weight_kilogram:.1f} kg")
+            print(f"Max Heart Rate: {measurements.max_heart_rate} bpm")
+
+        # Get recent cycles (last 7 days)
+        print("\n--- Recent Cycles (Last 7 Days) ---")
+        # Format the date range once; the API accepts ISO-8601 strings directly
+        now = datetime.now(tz=timezone.utc)
+        end_date = now.isoformat(timespec="seconds")
+        start_date = (now - timedelta(days=7)).isoformat(timespec="seconds")
+
+        try:
+            print("About to call cycles.get_all...")
+            cycles = client.cycles.get_all(start=start_date, end=end_date, limit_per_page=10)
+            print(f"Found {len(cycles)} cycles")
+            for cycle in cycles[:3]:  # Show first 3
+                print(f"\nCycle {cycle.id}:")
+                print(f"  Start: {cycle.start}")
+                print(f"  End: {cycle.end or 'Ongoing'}")
+                if cycle.score:
+                    print(f"  Strain: {cycle.score.strain:.1f}")
+                    print(f"  Calories: {cycle.score.calories:.0f}")
+        except Exception as e:
+            print(f"Failed to get cycles: {e}")
+
+        # Get recent sleep
+        print("\n--- Recent Sleep Activities ---")
+        try:
+            sleep_activities = client.sleep.get_all(start=start_date, end=end_date, limit_per_page=5)
+            print(f"Found {len(sleep_activities)} sleep activities")
+            for sleep in sleep_activities[:2]:  # Show first 2
+                print(f"\nSleep {sleep.id}:")
+                print(f"  Duration: {sleep.duration_hours:.1f} hours")
+                print(f"  Nap: {'Yes' if sleep.nap else 'No'}")
+                if sleep.score and sleep.score.stage_summary:
+                    summary = sleep.score.stage_summary
+                    print(f"  Sleep Efficiency: {summary.sleep_efficiency_percentage:.1f}%")
+        except ResourceNotFoundError:
+            print("No sleep data found for the specified date range")
+        except RateLimitError as e:
+            print(f"Rate limit reached for sleep data: {e}")
+            print("Consider increasing request_delay or reducing date range")
+        except Exception as e:
+            print(f"Failed to get sleep data: {e}")
+
+        # Get recent workouts (limit to 3 days to avoid rate limits)
+        print("\n--- Recent Workouts (Last 3 Days) ---")
+        try:
+            # Use a shorter date range for workouts to avoid excessive API calls
+            workout_start = (now - timedelta(days=3)).isoformat(timespec="seconds")
+            workouts = client.workouts.get_all(
+                start=workout_start,
+                end=end_date,
+                limit_per_page=25,  # Larger page size to reduce API calls
+                max_records=10,  # Limit total records to prevent rate limits
+            )
+            print(f"Found {len(workouts)} workouts (limited to 10 most recent)")
+            for workout in workouts[:3]:  # Show first 3
+                print(f"\nWorkout: {workout.sport_name}")
+                print(f"  Duration: {workout.duration_hours:.1f} hours")
+                if workout.score:
+                    print(f"  Strain: {workout.score.strain:.1f}")
+                    print(f"  Calories: {workout.score.calories:.0f}")
+        except ResourceNotFoundError:
+            print("No workouts found for the specified date range")
+        except RateLimitError as e:
+            print(f"Rate limit reached for workouts: {e}")
+            print("Consider increasing request_delay or reducing date range")
+        except Exception as e:
+            print(f"Failed to get workouts: {e}")
+
+        # Get recovery data as DataFrame
+        # Note: Recovery endpoints often return 404 even with proper scopes.
+        # This appears to be a user/subscription-specific limitation.
+        print("\n--- Recovery Data (as DataFrame) ---")
+        recovery_columns = ["cycle_id", "score.recovery_score", "score.hrv_rmssd_milli"]
+        try:
+            if pl is not None:
+                recovery_pl = client.recovery.get_polars(start=start_date, end=end_date)
+                if not recovery_pl.is_empty():
+                    print(f"Recovery data shape: {recovery_pl.shape}")
+                    print("\nRecovery scores:")
+                    if "score.recovery_score" in recovery_pl.columns:
+                        print(recovery_pl.lazy().select(recovery_columns).head().collect())
+                else:
+                    print("No recovery data found")
+            else:
+                recovery_df = client.recovery.get_dataframe(start=start_date, end=end_date)
+                if not recovery_df.empty:
+                    print(f"Recovery data shape: {recovery_df.shape}")
+                    print("\nRecovery scores:")
+                    if "score.recovery_score" in recovery_df.columns:
+                        print(recovery_df[recovery_columns].head())
+                else:
+                    print("No recovery data found")
+        except ResourceNotFoundError:
+            print("No recovery data available for this user")
+            print("Note: Recovery data may not be available for all users or subscription levels")
+        except RateLimitError as e:
+            print(f"Rate limit reached for recovery data: {e}")
+        except Exception as e:
+            print(f"Failed to get recovery data: {e}")
+
+
+async def _fetch_or_empty(label: str, coro: Awaitable[list[Any]]) -> list[Any]:
+    """Await a collection request, reporting expected API errors and returning an empty list for them."""
+    try:
+        return await coro
+    except ResourceNotFoundError:
+        print(f"No {label} found for the specified date range")
+    except RateLimitError as e:
+        print(f"Rate limit reached for {label}: {e}")
+    return []
+
+
+async def example_async(verbose: bool = False) -> None:
+    """Example using the asynchronous API (v2)."""
+    print("\n\n=== Asynchronous Example (v2 API) ===\n")
+
+    # Logging is already configured from sync example
+
+    try:
+        # Load config first
+        config = load_config(BASE_CONFIG_PATH)
+
+        # Try to load token
+        oauth_helper = OAuth2Helper(client_id=config["client_id"], client_secret=config["client_secret"])
+        token_info = oauth_helper.load_token()
+
+        if not token_info:
+            print("No saved credentials found. Please run the sync example first to authenticate.")
+            return
+
+        # Create client with existing token and a token-bucket rate limit (allows bursts up to the quota)
+        client = WhoopClientV2(  # type: ignore[misc]
+            token_info=token_info,
+            client_id=config["client_id"],
+            client_secret=config["client_secret"],
+            max_requests_per_minute=60,  # Stay well below the Whoop API quota
+            max_concurrent_requests=3,  # Limit concurrent requests
+            logger=logging.getLogger("whoopy") if verbose else None,
+        )
+
+        # Check if token needs refresh before starting
+        if token_info.is_expired:
+            print("Token is expired. It will be refreshed when the client initializes.")
+
+        async with client as whoop:
+            # Get user profile
+            print("--- User Profile ---")
+            try:
+                profile = await whoop.user.get_profile()
+                print(f"Name: {profile.first_name} {profile.last_name}")
+            except AuthenticationError as e:
+                print(f"Failed to get user profile: {e}")
+                print("Authentication failed. Token might be invalid.")
+                return
+            except Exception as e:
+                print(f"Failed to get user profile: {e}")
+
+            # Get recent data concurrently
+            # Use one identical range for all concurrent requests
+            now = datetime.now(tz=timezone.utc)
+            end_date = now.isoformat(timespec="seconds")
+            start_date = (now - timedelta(days=3)).isoformat(timespec="seconds")
+
+            print("\n--- Fetching data concurrently ---")
+
+            # Fetch multiple data types concurrently
+            try:
+                # Expected per-endpoint errors become empty results; anything else (e.g. auth
+                # failures) cancels the sibling requests instead of letting them finish for nothing
+                tasks = [
+                    asyncio.create_task(
+                        _fetch_or_empty(
+                            "cycles", whoop.cycles.get_all(start=start_date, end=end_date, limit_per_page=25)
+                        )
+                    ),
+                    asyncio.create_task(
+                        _fetch_or_empty(
+                            "sleep activities", whoop.sleep.get_all(start=start_date, end=end_date, limit_per_page=25)
+                        )
+                    ),
+                    asyncio.create_task(
+                        _fetch_or_empty(
+                            "workouts",
+                            whoop.workouts.get_all(
+                                start=start_date,
+                                end=end_date,
+                                limit_per_page=25,
+                                max_records=10,  # Limit to prevent excessive API calls
+                            ),
+                        )
+                    ),
+                ]
+                try:
+                    cycles, sleep_activities, workouts = await asyncio.gather(*tasks)
+                except Exception:
+                    for task in tasks:
+                        task.cancel()
+                    raise
+
+                MIN_EXAMPLES = 3  # Minimum number of examples to show
+                print(
+                    f"Fetched {len(cycles)} cycles, {len(sleep_activities)} sleep activities, {len(workouts)} workouts"
+                )
+
+                # Example of using async iterator
+                print("\n--- Iterating through cycles ---")
+                count = 0
+                try:
+                    async for cycle in whoop.cycles.iterate(start=start_date, end=end_date):
+                        print(f"Cycle {cycle.id}: Strain {cycle.score.strain if cycle.score else 'N/A'}")
+                        count += 1
+                        if count >= MIN_EXAMPLES:  # Limit output
+                            break
+                except ResourceNotFoundError:
+                    print("No cycles found to iterate through")
+                except RateLimitError as e:
+                    print(f"Rate limit reached during iteration: {e}")
+                    print("\nTip: To avoid rate limits, consider:")
+                    print("  - Lowering max_requests_per_minute (current: 60)")
+                    print("  - Reducing the date range for queries")
+                    print("  - Using smaller limit_per_page values")
+            except Exception as e:
+                print(f"Error fetching data: {e}")
+
+    except Exception as e:
+        print(f"Error in async example: {e}")
+        if verbose:
+            traceback.print_exc()
+
+
+def main() -> None:
+    """Main function to run both examples."""
+    # Parse command line arguments
+    parser = argparse.ArgumentParser(description="Whoopy Example Script - Demonstrates Whoop API v2 usage")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Enable verbose logging output")
+    parser.add_argument("--sync-only", action="store_true", help="Run only the synchronous example")
+    parser.add_argument("--async-only", action="store_true", help="Run only the asynchronous example")
+    args = parser.parse_args()
+
+    print("Whoopy Example Script")
+    print("====================\n")
+
+    if args.verbose:
+        print("Verbose mode enabled\n")
+
+    # Check if config exists (try multiple locations)
+    config_locations = [Path("config.json"), BASE_CONFIG_PATH, _HERE / "config.json"]
+
+    config_exists = any(path.is_file() for path in config_locations)
+
+    if not config_exists:
+        print("No config.json found!")
+        print("\nTo get started:")
+        print("1. Create a Whoop developer account at https://developer.whoop.com")
+        print("2. Create a new application to get your client_id and client_secret")
+        print("3. Create a config.json file with your credentials")
+        print("4. Run this script again with: uv run python -m whoopy.example")
+        print(f"\nSearched in: {', '.join(str(path) for path in config_locations)}")
+        return
+
+    # Run examples based on arguments
+    if not args.async_only:
+        # Run synchronous example
+        try:
+            print("Starting sync example...")
+            example_sync(verbose=args.verbose)
+        except Exception as e:
+            print(f"Error in sync example: {e}")
+            if args.verbose:
+                traceback.print_exc()
+
+    if not args.sync_only:
+        # Run asynchronous example
+        try:
+            print("\nStarting async example...")
+            asyncio.run(example_async(verbose=args.verbose))
+        except Exception as e:
+            print(f"Error in async example: {e}")
+            if args.verbose:
+                traceback.print_exc()
+
+    print("\n\nExample completed!")
+
+    # Flush any pending log messages
+    logging.shutdown()
+
+
+if __name__ == "__main__":
+    main()
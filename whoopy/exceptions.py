@@ -95,6 +95,17 @@ class ServerError(WhoopException):
         self.status_code = status_code
 
 
+class SessionClosedError(WhoopException, RuntimeError):
+    """Raised when the client is used without an open HTTP session."""
+
+    def __init__(
+        self,
+        message: str = "Client session not initialized. Use 'async with' context manager.",
+        details: dict[str, Any] | None = None,
+    ):
+        super().__init__(message, details)
+
+
 class ConfigurationError(WhoopException):
     """Raised when there's a configuration issue with the client."""
 
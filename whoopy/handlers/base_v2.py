@@ -5,21 +5,24 @@ Copyright (c) 2024 Felix Geilert
 
 from __future__ import annotations
 
+import json
 from abc import ABC
 from collections.abc import AsyncIterator
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 if TYPE_CHECKING:
-    from whoopy.client_v2 import WhoopClientV2
+    import pandas as pd
+    import polars as pl
 
-import pandas as pd
+    from whoopy.client_v2 import WhoopClientV2
 
 from whoopy.exceptions import ResourceNotFoundError
 from whoopy.models import models_v2 as models
 from whoopy.utils import PaginatedResponse, PaginationHelper
 
 T = TypeVar("T", bound=models.BaseWhoopModel)
+M = TypeVar("M", bound=models.BaseWhoopModel)
 
 
 class BaseHandler(ABC):  # noqa: B024
@@ -36,13 +39,21 @@ class BaseHandler(ABC):  # noqa: B024
 
     async def _get(self, path: str, **kwargs: Any) -> Any:
         """Make a GET request."""
+        return json.loads(await self._get_raw(path, **kwargs))
+
+    async def _get_raw(self, path: str, **kwargs: Any) -> bytes:
+        """Make a GET request and return the undecoded response body."""
         response = await self.client.request("GET", path, **kwargs)
-        return await response.json()
+        return await response.read()  # type: ignore[no-any-return]
+
+    async def _get_model(self, path: str, model_class: type[M], **kwargs: Any) -> M:
+        """Make a GET request and validate the JSON body directly into a model."""
+        return model_class.model_validate_json(await self._get_raw(path, **kwargs))
 
     async def _post(self, path: str, **kwargs: Any) -> Any:
         """Make a POST request."""
         response = await self.client.request("POST", path, **kwargs)
-        return await response.json()
+        return json.loads(await response.read())
 
     def _parse_datetime(self, dt: str | datetime | None) -> str | None:
         """Parse datetime to ISO format string."""
@@ -57,8 +68,6 @@ class BaseHandler(ABC):  # noqa: B024
             # Ensure datetime is timezone-aware
             if dt.tzinfo is None:
                 # Assume UTC for naive datetimes
-                from datetime import timezone
-
                 dt = dt.replace(tzinfo=timezone.utc)
 
             # Convert to ISO format with Z suffix
@@ -66,6 +75,16 @@ class BaseHandler(ABC):  # noqa: B024
 
         raise ValueError(f"Invalid datetime type: {type(dt)}")
 
+    def _to_datetime(self, dt: str | datetime) -> datetime:
+        """Convert an ISO string or datetime to a timezone-aware datetime (UTC if naive)."""
+        if isinstance(dt, str):
+            dt = datetime.fromisoformat(dt.replace("Z", "+00:00"))
+
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+
+        return dt
+
 
 class ResourceHandler(BaseHandler, Generic[T]):
     """Base handler for single resources."""
@@ -98,8 +117,7 @@ class ResourceHandler(BaseHandler, Generic[T]):
         """
         try:
             path = f"{self.resource_path}/{resource_id}"
-            data = await self._get(path)
-            return self.model_class(**data)
+            return await self._get_model(path, self.model_class)
         except Exception as e:
             if "404" in str(e):
                 raise ResourceNotFoundError(
@@ -153,10 +171,10 @@ class CollectionHandler(BaseHandler, Generic[T]):
             cleaned_params["nextToken"] = params["next_token"]
 
         # Make request
-        data = await self._get(self.collection_path, params=cleaned_params)
+        raw = await self._get_raw(self.collection_path, params=cleaned_params)
 
-        # Parse response
-        response = self.response_class(**data)
+        # Parse response straight from JSON bytes into models (no intermediate dict)
+        response = self.response_class.model_validate_json(raw)  # type: ignore[attr-defined]
         return PaginatedResponse(records=response.records, next_token=response.next_token)
 
     async def get_page(
@@ -186,6 +204,7 @@ class CollectionHandler(BaseHandler, Generic[T]):
         end: str | datetime | None = None,
         limit_per_page: int = 25,
         max_records: int | None = None,
+        concurrency: int = 1,
     ) -> list[T]:
         """
         Get all items across all pages.
@@ -195,10 +214,20 @@ class CollectionHandler(BaseHandler, Generic[T]):
             end: End time filter
             limit_per_page: Items per page (1-25)
             max_records: Maximum total items to fetch
+            concurrency: Number of date sub-ranges to page through concurrently. Only used
+                when both start and end are given and max_records is not set.
 
         Returns:
             List of all items
         """
+        if concurrency > 1 and start is not None and end is not None and max_records is None:
+            return await self._pagination.get_all_windowed(
+                start=self._to_datetime(start),
+                end=self._to_datetime(end),
+                windows=concurrency,
+                limit_per_page=limit_per_page,
+            )
+
         return await self._pagination.get_all(
             start=start, end=end, limit_per_page=limit_per_page, max_records=max_records
         )
@@ -226,6 +255,7 @@ class CollectionHandler(BaseHandler, Generic[T]):
         end: str | datetime | None = None,
         limit_per_page: int = 25,
         max_records: int | None = None,
+        concurrency: int = 1,
     ) -> pd.DataFrame:
         """
         Get all items as a pandas DataFrame.
@@ -235,14 +265,46 @@ class CollectionHandler(BaseHandler, Generic[T]):
             end: End time filter
             limit_per_page: Items per page (1-25)
             max_records: Maximum total items to fetch
+            concurrency: Number of date sub-ranges to page through concurrently
 
         Returns:
             DataFrame with all items
         """
-        items = await self.get_all(start=start, end=end, limit_per_page=limit_per_page, max_records=max_records)
+        items = await self.get_all(
+            start=start, end=end, limit_per_page=limit_per_page, max_records=max_records, concurrency=concurrency
+        )
 
         return models.models_to_dataframe(items)  # type: ignore[arg-type]
 
+    async def get_polars(
+        self,
+        start: str | datetime | None = None,
+        end: str | datetime | None = None,
+        limit_per_page: int = 25,
+        max_records: int | None = None,
+        concurrency: int = 1,
+    ) -> pl.DataFrame:
+        """
+        Get all items as a Polars DataFrame.
+
+        Requires the optional ``polars`` dependency. Column names match `get_dataframe`.
+
+        Args:
+            start: Start time filter
+            end: End time filter
+            limit_per_page: Items per page (1-25)
+            max_records: Maximum total items to fetch
+            concurrency: Number of date sub-ranges to page through concurrently
+
+        Returns:
+            Polars DataFrame with all items
+        """
+        items = await self.get_all(
+            start=start, end=end, limit_per_page=limit_per_page, max_records=max_records, concurrency=concurrency
+        )
+
+        return models.models_to_polars(items)  # type: ignore[arg-type]
+
 
 class CombinedHandler(ResourceHandler[T], CollectionHandler[T]):
     """Handler that supports both single resource and collection operations."""
@@ -5,8 +5,9 @@ Copyright (c) 2024 Felix Geilert
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal, overload
 from uuid import UUID
 
 from whoopy.exceptions import ResourceNotFoundError
@@ -23,13 +24,38 @@ class UserHandler(BaseHandler):
 
     async def get_profile(self) -> models.UserBasicProfile:
         """Get the authenticated user's basic profile."""
-        data = await self._get("user/profile/basic")
-        return models.UserBasicProfile(**data)
+        return await self._get_model("user/profile/basic", models.UserBasicProfile)
 
     async def get_body_measurements(self) -> models.UserBodyMeasurement:
         """Get the authenticated user's body measurements."""
-        data = await self._get("user/measurement/body")
-        return models.UserBodyMeasurement(**data)
+        return await self._get_model("user/measurement/body", models.UserBodyMeasurement)
+
+    @overload
+    async def get_profile_and_measurements(
+        self, return_exceptions: Literal[False] = False
+    ) -> tuple[models.UserBasicProfile, models.UserBodyMeasurement]: ...
+
+    @overload
+    async def get_profile_and_measurements(
+        self, return_exceptions: bool
+    ) -> tuple[models.UserBasicProfile | BaseException, models.UserBodyMeasurement | BaseException]: ...
+
+    async def get_profile_and_measurements(
+        self, return_exceptions: bool = False
+    ) -> tuple[models.UserBasicProfile | BaseException, models.UserBodyMeasurement | BaseException]:
+        """
+        Get the authenticated user's basic profile and body measurements concurrently.
+
+        Args:
+            return_exceptions: Return a failed request's exception in place of its result (as
+                asyncio.gather does), so one failing endpoint does not discard the other
+
+        Returns:
+            Tuple of (profile, body measurements)
+        """
+        return await asyncio.gather(
+            self.get_profile(), self.get_body_measurements(), return_exceptions=return_exceptions
+        )
 
 
 class CycleHandler(CombinedHandler[models.Cycle]):
@@ -64,8 +90,7 @@ class CycleHandler(CombinedHandler[models.Cycle]):
             ResourceNotFoundError: If cycle or sleep not found
         """
         try:
-            data = await self._get(f"cycle/{cycle_id}/sleep")
-            return models.Sleep(**data)
+            return await self._get_model(f"cycle/{cycle_id}/sleep", models.Sleep)
         except Exception as e:
             if "404" in str(e):
                 raise ResourceNotFoundError(resource_type="Sleep for Cycle", resource_id=str(cycle_id)) from e
@@ -138,8 +163,7 @@ class RecoveryHandler(CollectionHandler[models.Recovery]):
             ResourceNotFoundError: If recovery not found
         """
         try:
-            data = await self._get(f"cycle/{cycle_id}/recovery")
-            return models.Recovery(**data)
+            return await self._get_model(f"cycle/{cycle_id}/recovery", models.Recovery)
         except Exception as e:
             if "404" in str(e):
                 raise ResourceNotFoundError(resource_type="Recovery for Cycle", resource_id=str(cycle_id)) from e
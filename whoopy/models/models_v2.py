@@ -5,10 +5,15 @@ Copyright (c) 2024 Felix Geilert
 
 from datetime import datetime
 from enum import Enum
+from functools import cache
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
-import pandas as pd
-from pydantic import BaseModel, ConfigDict, Field, computed_field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, computed_field
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
 
 
 class ScoreState(str, Enum):
@@ -27,6 +32,8 @@ class BaseWhoopModel(BaseModel):
         populate_by_name=True,
         use_enum_values=True,
         str_strip_whitespace=True,
+        # API records are read-only snapshots; freezing makes them hashable and safe to share
+        frozen=True,
     )
 
 
@@ -430,7 +437,21 @@ SPORT_IDS = {
 
 
 # Helper functions for DataFrame conversion
-def models_to_dataframe(models: list[BaseWhoopModel]) -> pd.DataFrame:
+@cache
+def _list_adapter(model_class: type[BaseWhoopModel]) -> TypeAdapter[list[Any]]:
+    """Get a cached adapter that serializes a whole list of models in one call."""
+    return TypeAdapter(list[model_class])  # type: ignore[valid-type]
+
+
+def _dump_models(models: list[BaseWhoopModel]) -> list[dict[str, Any]]:
+    """Convert models to dictionaries, serializing homogeneous batches in a single pydantic-core pass."""
+    model_types = {type(model) for model in models}
+    if len(model_types) == 1:
+        return _list_adapter(model_types.pop()).dump_python(models)  # type: ignore[no-any-return]
+    return [model.model_dump() for model in models]
+
+
+def models_to_dataframe(models: list[BaseWhoopModel]) -> "pd.DataFrame":
     """
     Convert a list of Pydantic models to a pandas DataFrame.
 
@@ -444,14 +465,14 @@ def models_to_dataframe(models: list[BaseWhoopModel]) -> pd.DataFrame:
     Returns:
         DataFrame with flattened structure from the models, or empty DataFrame if no models
     """
+    # Imported here so that using the client without DataFrames never pays for pandas/numpy
+    import pandas as pd
+
     if not models:
         return pd.DataFrame()
 
-    # Convert models to dictionaries
-    data = [model.model_dump() for model in models]
-
     # Create DataFrame
-    df = pd.json_normalize(data)
+    df = pd.json_normalize(_dump_models(models))
 
     # Convert datetime columns
     datetime_columns = [col for col in df.columns if col.endswith("_at") or col in ["start", "end"]]
@@ -460,3 +481,39 @@ def models_to_dataframe(models: list[BaseWhoopModel]) -> pd.DataFrame:
             df[col] = pd.to_datetime(df[col])
 
     return df
+
+
+def models_to_polars(models: list[BaseWhoopModel]) -> "pl.DataFrame":
+    """
+    Convert a list of Pydantic models to a Polars DataFrame.
+
+    Nested models are flattened into dot-separated columns (e.g. ``score.recovery_score``),
+    matching the column names produced by `models_to_dataframe`. Datetime fields keep
+    their native Polars datetime type. Call ``.lazy()`` on the result to build column
+    projections without materializing unused columns.
+
+    Requires the optional ``polars`` dependency (``pip install whoopy[polars]``).
+
+    Args:
+        models: List of BaseWhoopModel instances to convert
+
+    Returns:
+        Polars DataFrame with flattened structure from the models, or empty DataFrame if no models
+    """
+    try:
+        import polars as pl
+    except ImportError as ex:
+        raise ImportError("polars is required for Polars output. Install it with: pip install whoopy[polars]") from ex
+
+    if not models:
+        return pl.DataFrame()
+
+    df = pl.json_normalize(_dump_models(models), separator=".", infer_schema_length=None)
+
+    # UUID fields (e.g. sleep ids) have no Arrow type and would land in Object columns, which
+    # Parquet/Arrow export cannot handle; store them as strings instead
+    object_columns = [name for name, dtype in df.schema.items() if dtype == pl.Object]
+    if object_columns:
+        df = df.with_columns(pl.col(object_columns).map_elements(str, return_dtype=pl.Utf8, skip_nulls=True))
+
+    return df
@@ -11,19 +11,21 @@ import asyncio
 import functools
 import logging
 import threading
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, TypeVar
 
 if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
+
     from whoopy.handlers import handlers_v2
 from uuid import UUID
 
-import pandas as pd
-
 from .client_v2 import WhoopClientV2
+from .exceptions import SessionClosedError
 from .models import models_v2 as models
-from .utils import RetryConfig, TokenInfo
+from .utils import OAuth2Helper, RetryConfig, TokenInfo
 
 T = TypeVar("T")
 
@@ -58,6 +60,10 @@ class EventLoopThread:
 
         if self.loop is None:
             raise RuntimeError("Event loop not initialized")
+        if threading.current_thread() is self.thread:
+            # Blocking on the loop from its own thread would deadlock
+            coro.close()
+            raise RuntimeError("Cannot call synchronous Whoop client methods from within its event loop")
         future = asyncio.run_coroutine_threadsafe(coro, self.loop)
         return future.result()
 
@@ -71,6 +77,20 @@ class EventLoopThread:
             self.loop = None
 
 
+_shared_loop_thread: EventLoopThread | None = None
+_shared_loop_lock = threading.Lock()
+
+
+def _get_shared_loop_thread() -> EventLoopThread:
+    """Get the process-wide event loop thread shared by all sync clients, starting it on first use."""
+    global _shared_loop_thread  # noqa: PLW0603
+    with _shared_loop_lock:
+        if _shared_loop_thread is None:
+            _shared_loop_thread = EventLoopThread()
+        _shared_loop_thread.start()
+        return _shared_loop_thread
+
+
 def async_to_sync(method: Callable[..., Any]) -> Callable[..., Any]:
     """
     Decorator to convert async methods to sync.
@@ -84,12 +104,12 @@ def async_to_sync(method: Callable[..., Any]) -> Callable[..., Any]:
 
     @functools.wraps(method)
     def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
-        # Ensure we have an event loop thread
-        if not hasattr(self, "_loop_thread") or self._loop_thread is None:
+        # Ensure we have an event loop thread (single lookup on the per-call path)
+        loop_thread = getattr(self, "_loop_thread", None)
+        if loop_thread is None:
             raise RuntimeError("Event loop thread not initialized")
 
-        coro = method(self, *args, **kwargs)
-        return self._loop_thread.run_coroutine(coro)
+        return loop_thread.run_coroutine(method(self, *args, **kwargs))
 
     return wrapper
 
@@ -118,6 +138,13 @@ class SyncUserHandler:
         """Get the authenticated user's body measurements."""
         return await self._handler.get_body_measurements()
 
+    @async_to_sync
+    async def get_profile_and_measurements(
+        self, return_exceptions: bool = False
+    ) -> tuple[models.UserBasicProfile | BaseException, models.UserBodyMeasurement | BaseException]:
+        """Get the authenticated user's basic profile and body measurements concurrently."""
+        return await self._handler.get_profile_and_measurements(return_exceptions)
+
 
 class SyncCollectionMixin:
     """Mixin for synchronous collection operations."""
@@ -154,6 +181,7 @@ class SyncCollectionMixin:
         end: str | datetime | None = None,
         limit_per_page: int = 25,
         max_records: int | None = None,
+        concurrency: int = 1,
     ) -> list[Any]:
         """
         Get all items across all pages.
@@ -163,37 +191,62 @@ class SyncCollectionMixin:
             end: End datetime for filtering results
             limit_per_page: Items per page (default: 25)
             max_records: Maximum total records to fetch (None for all)
+            concurrency: Number of date sub-ranges to page through concurrently (default: 1)
 
         Returns:
             List of all items across all pages
         """
-        return await self._handler.get_all(start=start, end=end, limit_per_page=limit_per_page, max_records=max_records)
+        return await self._handler.get_all(
+            start=start, end=end, limit_per_page=limit_per_page, max_records=max_records, concurrency=concurrency
+        )
 
     def iterate(
         self, start: str | datetime | None = None, end: str | datetime | None = None, limit_per_page: int = 25
-    ) -> list[Any]:
+    ) -> Iterator[Any]:
         """
         Iterate over all items across all pages.
 
-        Note: In sync mode, this returns all items as a list rather than yielding.
+        Items are yielded as soon as their page arrives. The async iterator runs on the
+        event loop thread and buffers at most two pages ahead of the consumer, so memory
+        stays bounded regardless of the total number of records.
 
         Args:
             start: Start datetime for filtering results
             end: End datetime for filtering results
             limit_per_page: Items per page (default: 25)
 
-        Returns:
-            List of all items
-        """
-
-        async def _iterate() -> list[Any]:
-            items = []
-            async for item in self._handler.iterate(start=start, end=end, limit_per_page=limit_per_page):
-                items.append(item)
-            return items
-
-        # Return all items as a list since we can't yield from sync
-        return self._loop_thread.run_coroutine(_iterate())
+        Yields:
+            Individual items
+        """
+
+        async def _start() -> tuple[asyncio.Queue[Any], asyncio.Task[None]]:
+            queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=2 * limit_per_page)
+
+            async def _produce() -> None:
+                try:
+                    async for item in self._handler.iterate(start=start, end=end, limit_per_page=limit_per_page):
+                        await queue.put(item)
+                except Exception as e:
+                    await queue.put(e)
+                    return
+                await queue.put(None)
+
+            return queue, asyncio.create_task(_produce())
+
+        loop_thread = self._loop_thread
+        queue, producer = loop_thread.run_coroutine(_start())
+        try:
+            while True:
+                item = loop_thread.run_coroutine(queue.get())
+                if item is None:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            # Stop fetching when the consumer breaks out early
+            if loop_thread.loop is not None:
+                loop_thread.loop.call_soon_threadsafe(producer.cancel)
 
     @async_to_sync
     async def get_dataframe(
@@ -202,7 +255,8 @@ class SyncCollectionMixin:
         end: str | datetime | None = None,
         limit_per_page: int = 25,
         max_records: int | None = None,
-    ) -> pd.DataFrame:
+        concurrency: int = 1,
+    ) -> "pd.DataFrame":
         # type: ignore[misc]
         """
         Get all items as a pandas DataFrame.
@@ -212,12 +266,40 @@ class SyncCollectionMixin:
             end: End datetime for filtering results
             limit_per_page: Items per page (default: 25)
             max_records: Maximum total records to fetch (None for all)
+            concurrency: Number of date sub-ranges to page through concurrently (default: 1)
 
         Returns:
             DataFrame containing all items with flattened structure
         """
         return await self._handler.get_dataframe(
-            start=start, end=end, limit_per_page=limit_per_page, max_records=max_records
+            start=start, end=end, limit_per_page=limit_per_page, max_records=max_records, concurrency=concurrency
+        )
+
+    @async_to_sync
+    async def get_polars(
+        self,
+        start: str | datetime | None = None,
+        end: str | datetime | None = None,
+        limit_per_page: int = 25,
+        max_records: int | None = None,
+        concurrency: int = 1,
+    ) -> "pl.DataFrame":
+        # type: ignore[misc]
+        """
+        Get all items as a Polars DataFrame.
+
+        Args:
+            start: Start datetime for filtering results
+            end: End datetime for filtering results
+            limit_per_page: Items per page (default: 25)
+            max_records: Maximum total records to fetch (None for all)
+            concurrency: Number of date sub-ranges to page through concurrently (default: 1)
+
+        Returns:
+            Polars DataFrame containing all items with flattened structure
+        """
+        return await self._handler.get_polars(
+            start=start, end=end, limit_per_page=limit_per_page, max_records=max_records, concurrency=concurrency
         )
 
 
@@ -401,6 +483,7 @@ class WhoopClientV2Sync:
         logger: logging.Logger | None = None,
         request_delay: float = 0.0,
         max_concurrent_requests: int = 10,
+        max_requests_per_minute: int | None = None,
     ):
         """
         Initialize the synchronous Whoop API v2 client.
@@ -415,6 +498,7 @@ class WhoopClientV2Sync:
             logger: Logger instance (creates default if None)
             request_delay: Delay in seconds between requests (default: 0)
             max_concurrent_requests: Maximum concurrent requests (default: 10)
+            max_requests_per_minute: Token-bucket rate limit allowing bursts up to this size (default: None)
         """
         self._async_client = WhoopClientV2(
             token_info=token_info,
@@ -426,6 +510,7 @@ class WhoopClientV2Sync:
             logger=logger,
             request_delay=request_delay,
             max_concurrent_requests=max_concurrent_requests,
+            max_requests_per_minute=max_requests_per_minute,
         )
 
         # Initialize sync handlers
@@ -459,9 +544,8 @@ class WhoopClientV2Sync:
                     "WhoopClientV2Sync.auth_flow() or provide a valid token."
                 )
 
-            # Create event loop thread
-            self._loop_thread = EventLoopThread()
-            self._loop_thread.start()
+            # All sync clients share one background loop, so no thread or loop is created per client
+            self._loop_thread = _get_shared_loop_thread()
 
             async def _init() -> None:
                 # Enter the async context to create session
@@ -484,7 +568,7 @@ class WhoopClientV2Sync:
         """Get the user handler."""
         self._ensure_initialized()
         if self._user is None:
-            raise RuntimeError("Client not initialized")
+            raise SessionClosedError("Client not initialized")
         return self._user
 
     @property
@@ -492,7 +576,7 @@ class WhoopClientV2Sync:
         """Get the cycles handler."""
         self._ensure_initialized()
         if self._cycles is None:
-            raise RuntimeError("Client not initialized")
+            raise SessionClosedError("Client not initialized")
         return self._cycles
 
     @property
@@ -500,7 +584,7 @@ class WhoopClientV2Sync:
         """Get the sleep handler."""
         self._ensure_initialized()
         if self._sleep is None:
-            raise RuntimeError("Client not initialized")
+            raise SessionClosedError("Client not initialized")
         return self._sleep
 
     @property
@@ -508,7 +592,7 @@ class WhoopClientV2Sync:
         """Get the recovery handler."""
         self._ensure_initialized()
         if self._recovery is None:
-            raise RuntimeError("Client not initialized")
+            raise SessionClosedError("Client not initialized")
         return self._recovery
 
     @property
@@ -516,7 +600,7 @@ class WhoopClientV2Sync:
         """Get the workouts handler."""
         self._ensure_initialized()
         if self._workouts is None:
-            raise RuntimeError("Client not initialized")
+            raise SessionClosedError("Client not initialized")
         return self._workouts
 
     @property
@@ -553,17 +637,25 @@ class WhoopClientV2Sync:
 
             if self._loop_thread:
                 self._loop_thread.run_coroutine(_cleanup())
-                self._loop_thread.stop()
-                self._loop_thread = None
 
             self._initialized = False
             self._session_context = None
 
-    @async_to_sync
-    async def refresh_token(self) -> None:
-        """Refresh the access token."""
+        # The loop thread is shared with other clients, so it is left running
+        self._loop_thread = None
+
+    def refresh_token(self, force: bool = False) -> None:
+        """
+        Refresh the access token.
+
+        Args:
+            force: Refresh even if the current token has not expired yet (default: False)
+        """
+        # Initialize before dispatching: the loop thread does not exist until then, and
+        # initializing from inside a coroutine on that loop would block on itself
         self._ensure_initialized()
-        await self._async_client.refresh_token()
+        assert self._loop_thread is not None  # Type guard
+        self._loop_thread.run_coroutine(self._async_client.refresh_token(force=force))
 
     # Class methods for authentication
     @classmethod
@@ -592,25 +684,15 @@ class WhoopClientV2Sync:
         Returns:
             Authenticated WhoopClientV2Sync instance
         """
+        oauth_helper = OAuth2Helper(
+            client_id=client_id, client_secret=client_secret, redirect_uri=redirect_uri, scopes=scopes
+        )
 
-        async def _auth() -> TokenInfo:
-            client = await WhoopClientV2.auth_flow(
-                client_id=client_id,
-                client_secret=client_secret,
-                redirect_uri=redirect_uri,
-                scopes=scopes,
-                open_browser=open_browser,
-            )
-            token = client.token_info
-            if token is None:
-                raise RuntimeError("Failed to authenticate")
-            return token
-
-        # Use asyncio.run for class method since no instance exists yet
-        token_info = asyncio.run(_auth())
+        # Prompt in the calling thread, so other sync clients on the shared loop keep running
+        # while the user authorizes
+        code = oauth_helper.prompt_for_code(open_browser)
 
-        return cls(
-            token_info=token_info,
+        client = cls(
             client_id=client_id,
             client_secret=client_secret,
             redirect_uri=redirect_uri,
@@ -618,6 +700,13 @@ class WhoopClientV2Sync:
             max_concurrent_requests=max_concurrent_requests,
         )
 
+        # Exchange the code over the session the client goes on to use, so its first API requests
+        # reuse the connection instead of paying a second handshake
+        _get_shared_loop_thread().run_coroutine(client._async_client.exchange_code(code, oauth_helper))
+        client._ensure_initialized()
+
+        return client
+
     @classmethod
     def from_token(
         cls,
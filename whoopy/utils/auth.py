@@ -5,12 +5,14 @@ Copyright (c) 2024 Felix Geilert
 
 import json
 import os
+import tempfile
 import uuid
 import webbrowser
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any, ClassVar
-from urllib.parse import urlencode
+from urllib.parse import parse_qsl, urlencode, urlparse
 
 import aiohttp
 
@@ -106,6 +108,51 @@ class TokenInfo:
         )
 
 
+@lru_cache(maxsize=4)
+def _parse_token_file(path: str, mtime_ns: int) -> TokenInfo | None:  # noqa: ARG001
+    """Parse a token file; cached per (path, mtime) so unchanged files are not re-read."""
+    try:
+        with open(path, "rb") as f:
+            return TokenInfo.from_dict(json.load(f))
+    except (FileNotFoundError, json.JSONDecodeError, KeyError, ValueError):
+        return None
+
+
+def _read_token_file(path: str, mtime_ns: int) -> TokenInfo | None:
+    """Get a parsed token file, as a copy so callers cannot mutate the cached token."""
+    token = _parse_token_file(path, mtime_ns)
+    if token is None:
+        return None
+    return replace(token, scopes=list(token.scopes))
+
+
+def save_token_file(token: TokenInfo, path: str) -> None:
+    """
+    Write a token file atomically.
+
+    Args:
+        token: TokenInfo to save
+        path: Path to save the token file
+    """
+    # Create directory if it doesn't exist
+    dir_path = os.path.dirname(path)
+    if dir_path:
+        os.makedirs(dir_path, exist_ok=True)
+
+    # Write to a uniquely named temporary file and rename it, so readers never see a partially
+    # written token and concurrent writers never share a temp file
+    fd, tmp_path = tempfile.mkstemp(dir=dir_path or ".", prefix=".whoop_token_", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(token.to_dict(), f, indent=2)
+            f.flush()
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    _parse_token_file.cache_clear()
+
+
 class OAuth2Helper:
     """Helper class for OAuth2 authentication flow."""
 
@@ -180,6 +227,38 @@ class OAuth2Helper:
         webbrowser.open(url)
         return url
 
+    def prompt_for_code(self, open_browser: bool = True) -> str:
+        """
+        Ask the user to authorize in the browser and paste back the redirect URL.
+
+        This blocks on input(), so async callers should run it in a worker thread.
+
+        Args:
+            open_browser: Whether to open the authorization URL in the browser
+
+        Returns:
+            The authorization code from the redirect URL
+
+        Raises:
+            AuthenticationError: If the redirect URL carries no authorization code
+        """
+        auth_url = self.get_authorization_url()
+        if open_browser:
+            print(f"Opening browser to: {auth_url}")
+            webbrowser.open(auth_url)
+        else:
+            print(f"Visit this URL to authorize: {auth_url}")
+
+        # Get authorization code from user
+        print(f"\nAfter authorization, you'll be redirected to: {self.redirect_uri}")
+        redirect_url = input("Paste the full redirect URL here: ").strip()
+
+        # Extract code from redirect URL
+        code = next((value for key, value in parse_qsl(urlparse(redirect_url).query) if key == "code"), None)
+        if not code:
+            raise AuthenticationError("No authorization code found in redirect URL")
+        return code
+
     async def exchange_code_for_token(self, session: aiohttp.ClientSession, code: str) -> TokenInfo:
         """Exchange authorization code for access token."""
         data = {
@@ -255,13 +334,7 @@ class OAuth2Helper:
             token: TokenInfo to save
             path: Path to save the token file (default: ".whoop_credentials.json")
         """
-        # Create directory if it doesn't exist
-        dir_path = os.path.dirname(path)
-        if dir_path and not os.path.exists(dir_path):
-            os.makedirs(dir_path, exist_ok=True)
-
-        with open(path, "w") as f:
-            json.dump(token.to_dict(), f, indent=2)
+        save_token_file(token, path)
 
     def load_token(self, path: str = ".whoop_credentials.json") -> TokenInfo | None:
         """
@@ -273,12 +346,9 @@ class OAuth2Helper:
         Returns:
             TokenInfo if file exists and is valid, None otherwise
         """
-        if not os.path.exists(path):
-            return None
-
         try:
-            with open(path) as f:
-                data = json.load(f)
-            return TokenInfo.from_dict(data)
-        except (json.JSONDecodeError, KeyError, ValueError):
+            mtime_ns = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
             return None
+
+        return _read_token_file(os.path.abspath(path), mtime_ns)
@@ -3,8 +3,11 @@
 Copyright (c) 2024 Felix Geilert
 """
 
+import asyncio
 from collections.abc import AsyncIterator, Awaitable, Callable
 from dataclasses import dataclass
+from datetime import datetime
+from itertools import pairwise
 from typing import Any, Generic, TypeVar
 
 from whoopy.constants import DEFAULT_PAGE_SIZE
@@ -25,6 +28,15 @@ class PaginatedResponse(Generic[T]):
         return self.next_token is not None
 
 
+def _record_key(record: Any) -> Any:
+    """Get the identity of a record: its id, or cycle_id for records keyed by cycle (recovery)."""
+    for attr in ("id", "cycle_id"):
+        key = getattr(record, attr, None)
+        if key is not None:
+            return key
+    return record
+
+
 class PaginationHelper(Generic[T]):
     """Helper class for handling paginated API responses."""
 
@@ -95,12 +107,47 @@ class PaginationHelper(Generic[T]):
 
         return all_records[:max_records] if max_records else all_records
 
+    async def get_all_windowed(
+        self, start: datetime, end: datetime, windows: int, limit_per_page: int = 25, **kwargs: Any
+    ) -> list[T]:
+        """
+        Fetch all records in a time range by paginating several sub-ranges concurrently.
+
+        The range is split into equal windows whose page cursors are walked in parallel,
+        so N pages cost roughly N / windows round-trips instead of N. Results are combined
+        newest window first, matching the API's descending order, and a record returned by
+        two adjacent windows is only kept once (the first version seen, by its id).
+
+        Args:
+            start: Start of the time range
+            end: End of the time range
+            windows: Number of sub-ranges to fetch concurrently
+            limit_per_page: Number of records per page (max 25)
+            **kwargs: Additional parameters to pass to fetch_page
+
+        Returns:
+            List of all records
+        """
+        results = await asyncio.gather(
+            *(
+                self.get_all(limit_per_page=limit_per_page, start=window_start, end=window_end, **kwargs)
+                for window_start, window_end in split_time_range(start, end, windows)
+            )
+        )
+        unique: dict[Any, T] = {}
+        for records in results:
+            for record in records:
+                unique.setdefault(_record_key(record), record)
+        return list(unique.values())
+
     async def iterate(self, limit_per_page: int = 25, **kwargs: Any) -> AsyncIterator[T]:
         """
         Iterate over all records across all pages.
 
         This is memory-efficient for large datasets as it yields
         records one at a time rather than loading all into memory.
+        The next page is prefetched in the background while the current
+        one is consumed (at most one page ahead).
 
         Args:
             limit_per_page: Number of records per page (max 25)
@@ -109,18 +156,32 @@ class PaginationHelper(Generic[T]):
         Yields:
             Individual records
         """
-        next_token = None
-
-        while True:
-            page = await self.get_page(limit=limit_per_page, next_token=next_token, **kwargs)
-
-            for record in page.records:
-                yield record
-
-            if not page.has_more:
-                break
+        # Bounded to a single page so prefetching never runs further ahead than needed
+        queue: asyncio.Queue[PaginatedResponse[T] | Exception | None] = asyncio.Queue(maxsize=1)
+
+        async def _produce() -> None:
+            try:
+                async for page in self.iterate_pages(limit_per_page=limit_per_page, **kwargs):
+                    await queue.put(page)
+            except Exception as e:
+                await queue.put(e)
+                return
+            await queue.put(None)
+
+        producer = asyncio.create_task(_produce())
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                if isinstance(item, Exception):
+                    raise item
 
-            next_token = page.next_token
+                for record in item.records:
+                    yield record
+        finally:
+            # Stop fetching when the consumer breaks out early
+            producer.cancel()
 
     async def iterate_pages(self, limit_per_page: int = 25, **kwargs: Any) -> AsyncIterator[PaginatedResponse[T]]:
         """
@@ -146,6 +207,31 @@ class PaginationHelper(Generic[T]):
             next_token = page.next_token
 
 
+def split_time_range(start: datetime, end: datetime, parts: int) -> list[tuple[datetime, datetime]]:
+    """
+    Split a time range into contiguous windows of equal length.
+
+    Args:
+        start: Start of the time range
+        end: End of the time range
+        parts: Number of windows
+
+    Returns:
+        List of (start, end) windows, newest first
+
+    Raises:
+        ValueError: If parts is less than 1
+    """
+    if parts < 1:
+        raise ValueError("parts must be at least 1")
+    if end <= start:
+        return [(start, end)]
+
+    step = (end - start) / parts
+    bounds = [start + step * i for i in range(parts)] + [end]
+    return list(pairwise(bounds))[::-1]
+
+
 def parse_pagination_params(params: dict[str, Any]) -> dict[str, Any]:
     """
     Parse and validate pagination parameters.
@@ -5,27 +5,99 @@ Copyright (c) 2024 Felix Geilert
 
 import asyncio
 import logging
+import math
 import random
-from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from dataclasses import dataclass, field
 from functools import wraps
-from typing import Any, TypeVar, cast
+from typing import Any, Final, Literal, TypeVar, cast
+
+from yarl import URL
 
 from whoopy.exceptions import RateLimitError, ServerError
 
 T = TypeVar("T")
 
+# Backoff delays at or below this many seconds are not worth a timer
+_MIN_SLEEP = 1e-3
+
+# Jitter source; a dedicated instance keeps retries independent of seeding of the global RNG
+_rng = random.Random()
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RetryConfig:
-    """Configuration for retry behavior."""
+    """Configuration for retry behavior (immutable, so one instance can be shared)."""
 
     max_attempts: int = 5  # Increased for better rate limit handling
     base_delay: float = 1.0
     max_delay: float = 60.0
     exponential_base: float = 2.0
     jitter: bool = True
+    # "equal" scales the backoff by 0.8-1.2; "full" picks uniformly from 0 to the backoff, which
+    # spreads retries of many clients failing at the same moment more evenly
+    jitter_mode: Literal["equal", "full"] = "equal"
+    # "exp" grows by exponential_base per attempt, "fib" follows the Fibonacci sequence in units of
+    # base_delay (slower growth), "fixed" always waits base_delay
+    strategy: Literal["exp", "fib", "fixed"] = "exp"
     retry_on: tuple[type[Exception], ...] = (RateLimitError, ServerError)
+    # Total time budget in seconds; a retry that could not start within it is not attempted
+    max_elapsed: float | None = None
+    _delays: tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _saturated: bool = field(init=False, repr=False, compare=False)
+    _retry_on_set: frozenset[type[Exception]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Derived fields are set through object.__setattr__ because the dataclass is frozen
+        # is_retryable answers exact types from the set and only scans the tuple for subclasses
+        object.__setattr__(self, "_retry_on_set", frozenset(self.retry_on))
+        # Capped backoff per attempt, computed once instead of on every retry
+        delays = self._backoff_table(self.max_attempts)
+        object.__setattr__(self, "_delays", delays)
+        # Backoff never shrinks unless exponential_base < 1, so once the table reaches max_delay
+        # every later attempt is max_delay as well
+        saturated = (
+            bool(delays) and delays[-1] >= self.max_delay and (self.strategy != "exp" or self.exponential_base >= 1)
+        )
+        object.__setattr__(self, "_saturated", saturated)
+
+    def _backoff_table(self, attempts: int) -> tuple[float, ...]:
+        """Compute the capped backoff for the first `attempts` attempts."""
+        if self.strategy == "fixed":
+            return (min(self.base_delay, self.max_delay),) * attempts
+
+        if self.strategy == "fib":
+            delays = []
+            a, b = self.base_delay, self.base_delay
+            for _ in range(attempts):
+                delays.append(min(a, self.max_delay))
+                a, b = b, a + b
+            return tuple(delays)
+
+        return tuple(
+            min(self.base_delay * (self.exponential_base**attempt), self.max_delay) for attempt in range(attempts)
+        )
+
+    def base_backoff(self, attempt: int) -> float:
+        """Get the capped backoff for an attempt (0-based), before jitter."""
+        if attempt < len(self._delays):
+            return self._delays[attempt]
+        if self._saturated:
+            return self.max_delay
+        return self._backoff_table(attempt + 1)[-1]
+
+    def schedule(self) -> Iterator[float]:
+        """Iterate over the capped backoff of each attempt, before jitter."""
+        return iter(self._delays)
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        """Check whether an exception should be retried under this configuration."""
+        return type(exc) in self._retry_on_set or isinstance(exc, self.retry_on)
+
+
+# Shared default, so callers without a config reuse one precomputed backoff table
+_DEFAULT_CONFIG: Final = RetryConfig()
 
 
 def calculate_backoff_delay(attempt: int, config: RetryConfig, retry_after: int | None = None) -> float:
@@ -35,26 +107,84 @@ def calculate_backoff_delay(attempt: int, config: RetryConfig, retry_after: int
     Args:
         attempt: The attempt number (0-based)
         config: Retry configuration parameters
-        retry_after: Server-provided retry delay in seconds (overrides backoff)
+        retry_after: Server-provided retry delay in seconds, used as a lower bound
 
     Returns:
         Delay in seconds before next retry
     """
-    if retry_after is not None:
-        # If server provides retry-after, use it (with small jitter)
-        delay = float(retry_after)
-        if config.jitter:
-            delay += random.uniform(0, 1)
-        return min(delay, config.max_delay)
-
     # Exponential backoff calculation
-    delay = config.base_delay * (config.exponential_base**attempt)
+    delay = config.base_backoff(attempt)
 
     # Add jitter to prevent thundering herd
     if config.jitter:
-        delay *= random.uniform(0.8, 1.2)
+        if config.jitter_mode == "full":
+            delay *= _rng.random()
+        else:
+            delay = min(delay * (0.8 + 0.4 * _rng.random()), config.max_delay)
+
+    if retry_after is not None:
+        # Never retry before the server allows it, since an early retry would only be rejected
+        # again; the small jitter keeps clients that share a reset time apart
+        floor = float(retry_after)
+        if config.jitter:
+            floor += _rng.random()
+        delay = max(delay, floor)
+
+    return delay
+
+
+def _with_retry(func: Callable[..., Awaitable[T]], config: RetryConfig) -> Callable[..., Awaitable[T]]:
+    """Wrap an async function in the retry loop without copying its metadata."""
+
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        last_exception = None
+        start = time.monotonic()
+
+        for attempt in range(config.max_attempts):
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                if not config.is_retryable(e):
+                    raise
+                last_exception = e
+
+                # Check if this is the last attempt
+                if attempt == config.max_attempts - 1:
+                    raise
+
+                # Calculate delay
+                # Only RateLimitError carries retry_after, so no type check is needed
+                retry_after = getattr(e, "retry_after", None)
+                # Waiting longer than max_delay is the caller's call; e.retry_after says how long
+                if retry_after is not None and retry_after > config.max_delay:
+                    raise
+
+                delay = calculate_backoff_delay(attempt, config, retry_after)
+
+                # Give up now rather than sleep past the budget
+                if config.max_elapsed is not None and time.monotonic() - start + delay > config.max_elapsed:
+                    raise
+
+                # Log retry attempt
+                logger = logging.getLogger("whoopy")
+                logger.warning(
+                    "Retrying after %s. Attempt %d/%d. Waiting %.1fs",
+                    type(e).__name__,
+                    attempt + 2,
+                    config.max_attempts,
+                    delay,
+                )
 
-    return min(delay, config.max_delay)
+                # Sleep before retry; sub-millisecond delays (possible with full jitter) only
+                # yield to the loop instead of scheduling a timer
+                await asyncio.sleep(delay if delay > _MIN_SLEEP else 0)
+
+        # This shouldn't be reached, but just in case
+        if last_exception:
+            raise last_exception
+        raise RuntimeError("Unexpected retry logic error")
+
+    return wrapper
 
 
 def retry_with_backoff(
@@ -70,47 +200,10 @@ def retry_with_backoff(
         Decorator function that adds retry logic
     """
     if config is None:
-        config = RetryConfig()
+        config = _DEFAULT_CONFIG
 
     def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
-        @wraps(func)
-        async def wrapper(*args: Any, **kwargs: Any) -> T:
-            last_exception = None
-
-            for attempt in range(config.max_attempts):
-                try:
-                    return await func(*args, **kwargs)
-                except config.retry_on as e:
-                    last_exception = e
-
-                    # Check if this is the last attempt
-                    if attempt == config.max_attempts - 1:
-                        raise
-
-                    # Calculate delay
-                    retry_after = None
-                    if isinstance(e, RateLimitError):
-                        retry_after = e.retry_after
-
-                    delay = calculate_backoff_delay(attempt, config, retry_after)
-
-                    # Log retry attempt
-                    logger = logging.getLogger("whoopy")
-                    logger.warning(
-                        f"Retrying after {type(e).__name__}. "
-                        f"Attempt {attempt + 2}/{config.max_attempts}. "
-                        f"Waiting {delay:.1f}s"
-                    )
-
-                    # Sleep before retry
-                    await asyncio.sleep(delay)
-
-            # This shouldn't be reached, but just in case
-            if last_exception:
-                raise last_exception
-            raise RuntimeError("Unexpected retry logic error")
-
-        return cast(Callable[..., Awaitable[T]], wrapper)
+        return cast(Callable[..., Awaitable[T]], wraps(func)(_with_retry(func, config)))
 
     return decorator
 
@@ -123,6 +216,7 @@ class RetryableSession:
         session: Any,
         retry_config: RetryConfig | None = None,
         check_response_func: Callable[[Any], Awaitable[None]] | None = None,
+        in_flight: asyncio.Semaphore | None = None,
     ) -> None:
         """
         Initialize RetryableSession.
@@ -131,12 +225,58 @@ class RetryableSession:
             session: The underlying session (e.g., aiohttp.ClientSession)
             retry_config: Configuration for retry behavior (uses defaults if None)
             check_response_func: Optional function to check response validity
+            in_flight: Optional semaphore held around each attempt's send, bounding requests in flight
         """
         self.session = session
-        self.retry_config = retry_config or RetryConfig()
+        self.retry_config = retry_config or _DEFAULT_CONFIG
         self.check_response_func = check_response_func
+        self.in_flight = in_flight
+
+        # Monotonic deadline set by a 429 with Retry-After; every request on the session waits
+        # for it, so concurrent callers do not each retry into the same rate limit window
+        self._gate_until = 0.0
+
+        # Wrap once per session rather than building a retry closure on every request; internal,
+        # so the functools.wraps metadata copy is skipped
+        self._request_with_retry = _with_retry(self._request_once, self.retry_config)
+
+    async def _wait_for_gate(self) -> None:
+        """Wait until the session-wide rate limit gate opens, or raise if it is too far away."""
+        wait = self._gate_until - time.monotonic()
+        if wait <= 0:
+            return
+
+        # Like a retry, never block longer than max_delay (or the max_elapsed budget); a longer
+        # wait is surfaced to the caller with the remaining time
+        config = self.retry_config
+        limit = config.max_delay if config.max_elapsed is None else min(config.max_delay, config.max_elapsed)
+        if wait > limit:
+            raise RateLimitError(retry_after=math.ceil(wait))
+
+        # Spread the waiters so they do not all fire the moment the gate opens
+        if config.jitter:
+            wait = min(wait + config.base_delay * _rng.random(), limit)
+        await asyncio.sleep(wait)
+
+    async def _request_once(self, method: str, url: str | URL, **kwargs: Any) -> Any:
+        """Make a single request and check its response."""
+        await self._wait_for_gate()
+        if self.in_flight is None:
+            response = await self.session.request(method, url, **kwargs)
+        else:
+            # Only the send holds a slot; backoff sleeps and gate waits happen outside it
+            async with self.in_flight:
+                response = await self.session.request(method, url, **kwargs)
+        if self.check_response_func:
+            try:
+                await self.check_response_func(response)
+            except RateLimitError as e:
+                if e.retry_after is not None:
+                    self._gate_until = max(self._gate_until, time.monotonic() + e.retry_after)
+                raise
+        return response
 
-    async def request(self, method: str, url: str, **kwargs: Any) -> Any:
+    async def request(self, method: str, url: str | URL, **kwargs: Any) -> Any:
         """
         Make a request with automatic retry logic.
 
@@ -151,15 +291,7 @@ class RetryableSession:
         Raises:
             Various exceptions based on retry configuration
         """
-
-        @retry_with_backoff(self.retry_config)
-        async def _request() -> Any:
-            response = await self.session.request(method, url, **kwargs)
-            if self.check_response_func:
-                await self.check_response_func(response)
-            return response
-
-        return await _request()
+        return await self._request_with_retry(method, url, **kwargs)
 
     async def get(self, url: str, **kwargs: Any) -> Any:
         """
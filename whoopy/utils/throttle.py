@@ -11,34 +11,80 @@ from typing import Any
 class RequestThrottler:
     """Throttle requests to prevent rate limiting."""
 
-    def __init__(self, delay: float = 0.0, max_concurrent: int = 10):
+    def __init__(
+        self,
+        delay: float = 0.0,
+        max_concurrent: int = 10,
+        rate_limit: int | None = None,
+        period: float = 60.0,
+    ):
         """
         Initialize the throttler.
 
         Args:
             delay: Minimum delay in seconds between requests
             max_concurrent: Maximum number of concurrent requests
+            rate_limit: Maximum number of requests per period (token bucket, allows bursts)
+            period: Length of the rate limit window in seconds (default: 60)
         """
         self.delay = delay
         self.max_concurrent = max_concurrent
+        self.rate_limit = rate_limit
+        self.period = period
         self._last_request_time = 0.0
+        self._paused_until = 0.0
         self._semaphore = asyncio.Semaphore(max_concurrent)
+        # Held only while a request is actually sent, so it bounds requests in flight without
+        # counting time spent in backoff or rate limit waits
+        self.in_flight = asyncio.Semaphore(max_concurrent)
         self._lock = asyncio.Lock()
 
+        # Token bucket state (starts full so the first burst is not delayed)
+        self._tokens = float(rate_limit) if rate_limit else 0.0
+        self._last_refill = time.monotonic()
+
+    async def _take_token(self) -> None:
+        """Wait until a token is available in the bucket and consume it."""
+        assert self.rate_limit  # Type guard
+        refill_rate = self.rate_limit / self.period
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(float(self.rate_limit), self._tokens + (now - self._last_refill) * refill_rate)
+                self._last_refill = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / refill_rate)
+
+    async def _wait_turn(self) -> None:
+        """Wait out any pause, rate limit and minimum delay before the next request."""
+        pause = self._paused_until - time.monotonic()
+        if pause > 0:
+            await asyncio.sleep(pause)
+
+        if self.rate_limit:
+            await self._take_token()
+
+        if self.delay > 0:
+            async with self._lock:
+                # Calculate time to wait
+                current_time = time.time()
+                time_since_last = current_time - self._last_request_time
+                wait_time = max(0, self.delay - time_since_last)
+
+                if wait_time > 0:
+                    await asyncio.sleep(wait_time)
+
+                self._last_request_time = time.time()
+
     async def acquire(self) -> None:
         """Acquire permission to make a request."""
         async with self._semaphore:
-            if self.delay > 0:
-                async with self._lock:
-                    # Calculate time to wait
-                    current_time = time.time()
-                    time_since_last = current_time - self._last_request_time
-                    wait_time = max(0, self.delay - time_since_last)
-
-                    if wait_time > 0:
-                        await asyncio.sleep(wait_time)
-
-                    self._last_request_time = time.time()
+            await self._wait_turn()
 
     def __enter__(self) -> "RequestThrottler":
         """Context manager entry."""
@@ -55,6 +101,15 @@ class RequestThrottler:
     async def __aexit__(self, *args: Any) -> None:
         """Async context manager exit."""
 
+    def pause(self, seconds: float) -> None:
+        """
+        Hold back new requests for a period of time.
+
+        Args:
+            seconds: Number of seconds to wait before the next request
+        """
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
     def adjust_delay(self, factor: float = 2.0) -> None:
         """
         Adjust the delay between requests.